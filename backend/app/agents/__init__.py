@@ -1 +1,118 @@
-"""Agent implementations for the multi-agent system."""
\ No newline at end of file
+"""Agent implementations for the multi-agent system."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_agent(name: str):
+    """
+    Get the singleton instance of a named agent.
+
+    Agent construction initializes an LLM client, binds tools, and parses
+    schemas — non-trivial work that should happen once per process, not
+    per request. lru_cache guarantees each agent is built exactly once
+    and reused everywhere (supervisor graph, API routes, tests).
+
+    Args:
+        name: Agent name, e.g. "supervisor" or "analysis_agent"
+
+    Returns:
+        The shared agent instance
+
+    Raises:
+        KeyError: If the agent name is unknown
+    """
+    # Imported lazily so `import app.agents` stays cheap and avoids
+    # circular imports with modules that only need the registry
+    from app.agents.analysis_agent import AnalysisAgent
+    from app.agents.data_ingestion_agent import DataIngestionAgent
+    from app.agents.notification_agent import NotificationAgent
+    from app.agents.query_agent import QueryAgent
+    from app.agents.report_agent import ReportAgent
+    from app.agents.supervisor import SupervisorAgent
+
+    classes = {
+        "supervisor": SupervisorAgent,
+        "data_ingestion_agent": DataIngestionAgent,
+        "analysis_agent": AnalysisAgent,
+        "query_agent": QueryAgent,
+        "report_agent": ReportAgent,
+        "notification_agent": NotificationAgent,
+    }
+    return classes[name]()
+
+
+class AgentPool:
+    """
+    Bounded pool of reusable agent instances.
+
+    A single shared instance serializes concurrent requests on whatever
+    internal state the agent holds (LLM client, tool caches). The pool
+    keeps up to ``size`` instances and hands each request exclusive use
+    of one, so parallel workflow executions don't contend. Instances are
+    built lazily — an idle deployment never pays for more than one.
+    """
+
+    def __init__(self, factory, size: int):
+        self._factory = factory
+        self._size = size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self._created = 0
+        self._create_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Check out an agent for exclusive use; returned on exit."""
+        agent = await self._get()
+        try:
+            yield agent
+        finally:
+            self._release(agent)
+
+    async def _get(self):
+        # Fast path: an idle instance is already available
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        async with self._create_lock:
+            if self._created < self._size:
+                self._created += 1
+                return self._factory()
+
+        # Pool exhausted — wait for a release
+        return await self._queue.get()
+
+    def _release(self, agent) -> None:
+        # Clear per-call state before the instance is reused, if the
+        # agent exposes a hook for it
+        reset = getattr(agent, "reset", None)
+        if callable(reset):
+            reset()
+        self._queue.put_nowait(agent)
+
+
+@lru_cache(maxsize=None)
+def get_agent_pool(name: str) -> AgentPool:
+    """
+    Get the shared :class:`AgentPool` for a named worker agent.
+
+    The first pooled instance is the registry singleton from
+    :func:`get_agent`, so existing direct users keep sharing it;
+    additional instances are created on demand up to
+    ``settings.AGENT_POOL_SIZE``.
+    """
+    from app.config import settings
+
+    pool = AgentPool(
+        factory=lambda: type(get_agent(name))(),
+        size=settings.AGENT_POOL_SIZE,
+    )
+    # Seed with the singleton so the common single-request case never
+    # constructs a second instance
+    pool._created = 1
+    pool._queue.put_nowait(get_agent(name))
+    return pool
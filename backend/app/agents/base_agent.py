@@ -11,18 +11,83 @@ This provides a foundation for all specialized agents with:
 - Logging and telemetry
 """
 
+import asyncio
+import json
 from typing import Any, Optional
 
+import httpx
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import toon
+    TOON_AVAILABLE = True
+except ImportError:
+    TOON_AVAILABLE = False
+
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_groq import ChatGroq
 
 from app.config import settings
+from app.utils.llm_batcher import get_batcher
 from app.utils.logger import get_logger
+from app.utils.semantic_cache import semantic_cache
 
 log = get_logger(__name__)
 
+# Agents sampling above this temperature skip the semantic cache —
+# their outputs are intentionally varied (e.g. report generation),
+# so replaying a cached response would defeat the purpose.
+CACHE_MAX_TEMPERATURE = 0.5
+
+# One-line legend appended to system prompts when context blocks are
+# serialized as TOON instead of JSON, so the LLM parses the format.
+TOON_LEGEND = (
+    "\n\nContext blocks may use TOON format: `key: value` lines for objects, "
+    "`items[N]{a,b}:` headers with one comma-separated row per item for arrays."
+)
+
+# Private context key carrying a pre-formatted context string, so a dict
+# fanned out to several agents is serialized once (see preformat_context)
+PREFORMATTED_KEY = "__preformatted__"
+
+# bind_tools re-encodes every tool's JSON schema, so the bound LLM is
+# cached per (provider, model, temperature, tool names) and shared by
+# agents with an identical configuration
+_bound_llm_cache: dict[tuple, Any] = {}
+
+# Single HTTP/2 client shared by every agent's LLM. Per-agent clients
+# each pay their own TCP+TLS handshakes and can't multiplex; one shared
+# client lets concurrent ainvoke/abatch calls share connections.
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the process-wide async HTTP client."""
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=30.0,
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client. Call at application shutdown."""
+    global _shared_http_client
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+        log.info("Shared LLM HTTP client closed")
+
 
 class BaseAgent:
     """
@@ -56,17 +121,49 @@ class BaseAgent:
             temperature: LLM temperature (0.0 = deterministic, 1.0 = creative)
         """
         self.name = name
+        # TOON context blocks need a parsing hint, added once here
+        # rather than on every turn
+        if TOON_AVAILABLE:
+            system_prompt = system_prompt + TOON_LEGEND
         self.system_prompt = system_prompt
+        # The system prompt is immutable per agent, so build the message
+        # object once instead of re-running Pydantic validation per call
+        self._system_message = SystemMessage(content=self.system_prompt)
         self.tools = tools or []
         self.temperature = temperature
         
         # Initialize LLM
         self.llm = self._initialize_llm(llm_provider, model_name, temperature)
+
+        # Resolved once: hasattr() on every execute() is a try/except
+        # under the hood, and the LLM class never changes per call
+        self._model_name = getattr(self.llm, "model_name", model_name or "unknown")
         
-        # Bind tools if provided
+        # Bind tools if provided (cached — bind_tools re-encodes schemas)
         if self.tools:
-            self.llm = self.llm.bind_tools(self.tools)
-        
+            bind_key = (
+                type(self.llm).__name__,
+                getattr(self.llm, "model_name", model_name),
+                temperature,
+                tuple(tool.name for tool in self.tools),
+            )
+            if bind_key not in _bound_llm_cache:
+                _bound_llm_cache[bind_key] = self.llm.bind_tools(self.tools)
+            self.llm = _bound_llm_cache[bind_key]
+
+        # Micro-batching: deterministic agents without tools can coalesce
+        # concurrent calls into one provider abatch request. Skipped for
+        # temperature > 0 (non-deterministic) and tool-bound agents
+        # (tool responses need per-call routing).
+        self._batcher = None
+        if temperature == 0.0 and not self.tools:
+            batcher_key = (
+                type(self.llm).__name__,
+                getattr(self.llm, "model_name", model_name),
+                temperature,
+            )
+            self._batcher = get_batcher(batcher_key, self.llm)
+
         log.info(
             "Agent initialized",
             agent_name=name,
@@ -106,9 +203,11 @@ class BaseAgent:
                 model=model,
                 temperature=temperature,
                 max_tokens=4096,  # Sufficient for most responses
+                http_async_client=get_shared_http_client(),
             )
         
         elif provider == "google":
+            # Gemini's SDK manages its own transport — no httpx client to share
             model = model_name or settings.GOOGLE_MODEL_NAME
             return ChatGoogleGenerativeAI(
                 api_key=settings.GOOGLE_API_KEY,
@@ -146,38 +245,74 @@ class BaseAgent:
                 message_length=len(message),
                 has_context=bool(context),
             )
-            
-            # Build messages for LLM
+
+            # Semantic cache check: skip the LLM round-trip entirely when a
+            # semantically equivalent prompt was answered recently
+            context_str = self._format_context(context) if context else ""
+            cache_key = None
+            if semantic_cache.enabled and self.temperature <= CACHE_MAX_TEMPERATURE:
+                cache_key = semantic_cache.make_key(
+                    self.name, self.system_prompt, message, context_str
+                )
+                # aget offloads the (CPU-bound) embedding to a thread so
+                # concurrent requests don't stall the event loop on it
+                cached_output = await semantic_cache.aget(cache_key)
+                if cached_output is not None:
+                    log.info(
+                        "Agent execution served from semantic cache",
+                        agent_name=self.name,
+                    )
+                    return {
+                        "agent_name": self.name,
+                        "success": True,
+                        "output": cached_output,
+                        "metadata": {
+                            "model": self._model_name,
+                            "temperature": self.temperature,
+                            "cached": True,
+                        },
+                    }
+
+            # Build messages for LLM (system message cached in __init__)
             messages = [
-                SystemMessage(content=self.system_prompt),
+                self._system_message,
                 HumanMessage(content=message),
             ]
             
-            # Add context if provided
+            # Add context if provided (already formatted for the cache key)
             if context:
-                context_str = self._format_context(context)
                 messages.append(
                     HumanMessage(content=f"Additional context:\n{context_str}")
                 )
             
-            # Invoke LLM
-            response = await self.llm.ainvoke(messages, config=config)
+            # Invoke LLM (via the micro-batching queue when eligible)
+            if self._batcher is not None:
+                response = await self._batcher.invoke(messages, config=config)
+            else:
+                response = await self.llm.ainvoke(messages, config=config)
             
-            # Extract output
-            output = response.content if hasattr(response, 'content') else str(response)
+            # Extract output (AIMessage always carries content; getattr
+            # covers exotic response types without a try/except per call)
+            output = getattr(response, 'content', None)
+            if output is None:
+                output = str(response)
             
             log.info(
                 "Agent execution completed",
                 agent_name=self.name,
                 output_length=len(output),
             )
+
+            # Store successful output for future semantically similar prompts
+            if cache_key is not None:
+                await semantic_cache.aput(cache_key, output)
             
             return {
                 "agent_name": self.name,
                 "success": True,
                 "output": output,
                 "metadata": {
-                    "model": self.llm.model_name if hasattr(self.llm, 'model_name') else "unknown",
+                    "model": self._model_name,
                     "temperature": self.temperature,
                 },
             }
@@ -196,7 +331,53 @@ class BaseAgent:
                 "error": str(e),
             }
     
-    def _format_context(self, context: dict[str, Any]) -> str:
+    async def execute_stream(
+        self,
+        message: str,
+        context: Optional[dict[str, Any]] = None,
+        config: Optional[RunnableConfig] = None,
+    ):
+        """
+        Execute agent and yield output tokens as they arrive.
+
+        Streaming variant of execute(): callers see the first token after
+        first-token latency instead of waiting for the full generation,
+        and downstream stages can start consuming prefix content.
+
+        Args:
+            message: User message or task description
+            context: Additional context (previous outputs, metadata)
+            config: LangChain runnable config (for callbacks, tags)
+
+        Yields:
+            Output text chunks as the LLM produces them
+        """
+        log.info(
+            "Agent streaming execution started",
+            agent_name=self.name,
+            message_length=len(message),
+        )
+
+        messages = [
+            self._system_message,
+            HumanMessage(content=message),
+        ]
+
+        if context:
+            context_str = self._format_context(context)
+            messages.append(
+                HumanMessage(content=f"Additional context:\n{context_str}")
+            )
+
+        async for chunk in self.llm.astream(messages, config=config):
+            content = getattr(chunk, 'content', None)
+            if content:
+                yield content
+
+        log.info("Agent streaming execution completed", agent_name=self.name)
+
+    @classmethod
+    def _format_context(cls, context: dict[str, Any]) -> str:
         """
         Format context dictionary into readable string for LLM.
         
@@ -208,18 +389,59 @@ class BaseAgent:
         
         Args:
             context: Context dictionary
-        
+
         Returns:
             Formatted context string
         """
-        lines = []
-        for key, value in context.items():
-            if isinstance(value, (dict, list)):
-                import json
-                value_str = json.dumps(value, indent=2)
-            else:
-                value_str = str(value)
-            
-            lines.append(f"**{key}:**\n{value_str}")
-        
-        return "\n\n".join(lines)
\ No newline at end of file
+        # Upstream callers fanning the same context out to several agents
+        # can pre-format once via preformat_context() — honor that here
+        preformatted = context.get(PREFORMATTED_KEY)
+        if preformatted is not None:
+            return preformatted
+
+        return "\n\n".join(
+            f"**{key}:**\n"
+            f"{cls._serialize_value(value) if isinstance(value, (dict, list)) else value}"
+            for key, value in context.items()
+        )
+
+    @classmethod
+    def preformat_context(cls, context: dict[str, Any]) -> dict[str, Any]:
+        """
+        Pre-format a context dict that will be shared across agents.
+
+        When a supervisor fans the same context out to sibling agents,
+        each would otherwise re-serialize the identical dict. This stamps
+        the formatted string into the dict under a private key so every
+        receiving agent's _format_context short-circuits.
+
+        Args:
+            context: Context dictionary shared across agents
+
+        Returns:
+            The same dict with the formatted string attached
+        """
+        context[PREFORMATTED_KEY] = cls._format_context(context)
+        return context
+
+    @staticmethod
+    def _serialize_value(value: Any) -> str:
+        """
+        Serialize a dict/list context value for the prompt.
+
+        Prefers TOON (Token-Oriented Object Notation) when available:
+        flat and tabular data serializes with 30-60% fewer tokens than
+        JSON since braces, quotes, and repeated keys disappear. Falls
+        back to compact JSON (no indentation — whitespace costs tokens)
+        for irregular structures or when TOON is not installed.
+        """
+        if TOON_AVAILABLE:
+            try:
+                return toon.dumps(value)
+            except Exception:
+                pass  # Irregular/deeply nested value — fall back to JSON
+        # orjson is a C extension ~10x faster than stdlib json; matters when
+        # context carries large query results or file contents
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(value).decode()
+        return json.dumps(value)
\ No newline at end of file
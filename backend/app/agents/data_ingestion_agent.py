@@ -14,6 +14,16 @@ from app.mcp.tools.file_reader import read_file
 from app.mcp.schemas import FileReadInput
 from app.utils.prompts import DATA_INGESTION_AGENT_PROMPT
 
+# Built once at import: StructuredTool.from_function re-parses the
+# args_schema Pydantic model on every call, so constructing it per
+# agent instantiation wastes CPU
+_READ_FILE_TOOL = StructuredTool.from_function(
+    coroutine=read_file,
+    name="read_file",
+    description="Read and parse files (text, JSON, CSV, PDF, Markdown). Returns file contents with metadata.",
+    args_schema=FileReadInput,
+)
+
 
 class DataIngestionAgent(BaseAgent):
     """
@@ -27,17 +37,9 @@ class DataIngestionAgent(BaseAgent):
     """
     
     def __init__(self):
-        # Wrap async function as LangChain tool
-        read_file_tool = StructuredTool.from_function(
-            coroutine=read_file,
-            name="read_file",
-            description="Read and parse files (text, JSON, CSV, PDF, Markdown). Returns file contents with metadata.",
-            args_schema=FileReadInput,
-        )
-        
         super().__init__(
             name="data_ingestion_agent",
             system_prompt=DATA_INGESTION_AGENT_PROMPT,
-            tools=[read_file_tool],
+            tools=[_READ_FILE_TOOL],
             temperature=0.2,
         )
@@ -14,6 +14,14 @@ from app.mcp.tools.api_caller import call_api
 from app.mcp.schemas import ApiCallInput
 from app.utils.prompts import NOTIFICATION_AGENT_PROMPT
 
+# Built once at import to avoid re-parsing the args_schema per instantiation
+_CALL_API_TOOL = StructuredTool.from_function(
+    coroutine=call_api,
+    name="call_api",
+    description="Make HTTP requests to external APIs (webhooks, Slack, etc.). Supports GET, POST, PUT, DELETE, PATCH methods.",
+    args_schema=ApiCallInput,
+)
+
 
 class NotificationAgent(BaseAgent):
     """
@@ -27,14 +35,6 @@ class NotificationAgent(BaseAgent):
     """
     
     def __init__(self):
-        # Wrap async function as LangChain tool
-        call_api_tool = StructuredTool.from_function(
-            coroutine=call_api,
-            name="call_api",
-            description="Make HTTP requests to external APIs (webhooks, Slack, etc.). Supports GET, POST, PUT, DELETE, PATCH methods.",
-            args_schema=ApiCallInput,
-        )
-        
         super().__init__(
             name="notification_agent",
             system_prompt=NOTIFICATION_AGENT_PROMPT,
@@ -14,6 +14,14 @@ from app.mcp.tools.database_connector import query_database
 from app.mcp.schemas import DatabaseQueryInput
 from app.utils.prompts import QUERY_AGENT_PROMPT
 
+# Built once at import to avoid re-parsing the args_schema per instantiation
+_QUERY_DATABASE_TOOL = StructuredTool.from_function(
+    coroutine=query_database,
+    name="query_database",
+    description="Execute SQL queries on PostgreSQL database. Returns query results with row count and columns.",
+    args_schema=DatabaseQueryInput,
+)
+
 
 class QueryAgent(BaseAgent):
     """
@@ -27,17 +35,10 @@ class QueryAgent(BaseAgent):
     """
     
     def __init__(self):
-        # Wrap async function as LangChain tool
-        query_database_tool = StructuredTool.from_function(
-            coroutine=query_database,
-            name="query_database",
-            description="Execute SQL queries on PostgreSQL database. Returns query results with row count and columns.",
-            args_schema=DatabaseQueryInput,
-        )
-        
         super().__init__(
             name="query_agent",
             system_prompt=QUERY_AGENT_PROMPT,
-            tools=[query_database_tool],
+            tools=[_QUERY_DATABASE_TOOL],
+            llm_provider="groq",  # Latency-critical, deterministic SQL generation
             temperature=0.0,
         )
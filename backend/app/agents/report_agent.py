@@ -27,5 +27,6 @@ class ReportAgent(BaseAgent):
             name="report_agent",
             system_prompt=REPORT_AGENT_PROMPT,
             tools=[],
+            llm_provider="google",  # Report quality over latency — Gemini handles long-form output well
             temperature=0.7,  # Higher creativity for engaging report writing
         )
\ No newline at end of file
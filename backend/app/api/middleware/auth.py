@@ -6,6 +6,9 @@ Authentication Middleware
 Provides API key authentication for protected endpoints.
 """
 
+import hmac
+import time
+
 from fastapi import Header, HTTPException, status
 
 from app.config import settings
@@ -13,28 +16,68 @@ from app.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Cached at module load to skip repeated settings attribute lookup per
+# request. Kept as bytes: compare_digest over str raises TypeError on
+# non-ASCII input (Starlette decodes headers as latin-1), which would
+# turn a garbage key into a 500 instead of a 401.
+_API_KEY_BYTES = settings.API_KEY.encode()
+
+# Token bucket for failed-auth logging: without it, an attacker spraying
+# bad keys turns every rejection into a log write (log I/O = latency) and
+# can flood the log pipeline
+_LOG_BUCKET_CAPACITY = 10.0
+_LOG_REFILL_PER_SECOND = 1.0
+_log_tokens = _LOG_BUCKET_CAPACITY
+_log_last_refill = time.monotonic()
+
+
+def _should_log_failure() -> bool:
+    """Rate-limit failed-auth log lines via a simple token bucket."""
+    global _log_tokens, _log_last_refill
+
+    now = time.monotonic()
+    _log_tokens = min(
+        _LOG_BUCKET_CAPACITY,
+        _log_tokens + (now - _log_last_refill) * _LOG_REFILL_PER_SECOND,
+    )
+    _log_last_refill = now
+
+    if _log_tokens >= 1.0:
+        _log_tokens -= 1.0
+        return True
+    return False
+
 
 async def verify_api_key(x_api_key: str = Header(..., description="API Key")):
     """
     Verify API key from request header.
-    
+
     Usage in routes:
         @router.get("/protected", dependencies=[Depends(verify_api_key)])
         async def protected_endpoint():
             return {"message": "Authenticated"}
-    
+
+    Uses hmac.compare_digest so comparison time doesn't depend on how many
+    leading bytes match — a plain != short-circuits on the first mismatched
+    byte, which leaks key bytes through response timing.
+
     Args:
         x_api_key: API key from X-API-Key header
-    
+
     Raises:
         HTTPException: If API key is invalid
     """
-    if x_api_key != settings.API_KEY:
-        log.warning("Invalid API key attempt", provided_key=x_api_key[:10] + "...")
+    provided = (x_api_key or "").encode("utf-8", "surrogateescape")
+    if not hmac.compare_digest(provided, _API_KEY_BYTES):
+        if _should_log_failure():
+            log.warning(
+                "Invalid API key attempt",
+                provided_key=(x_api_key[:10] + "...") if x_api_key else "<empty>",
+            )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
             headers={"WWW-Authenticate": "ApiKey"},
         )
-    
-    return x_api_key
\ No newline at end of file
+
+    return x_api_key
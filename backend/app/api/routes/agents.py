@@ -4,10 +4,12 @@
 Agent Invocation Endpoints with Robust Error Handling
 """
 
+import json
 import uuid
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.graphs.supervisor_graph import execute_agent_workflow
@@ -97,6 +99,42 @@ async def invoke_agents(request: AgentInvokeRequest):
         )
 
 
+@router.post(
+    "/invoke/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Invoke supervisor with streamed response",
+)
+async def invoke_agents_stream(request: AgentInvokeRequest):
+    """
+    Stream the supervisor's response as Server-Sent Events.
+
+    Tokens are forwarded as they arrive from the LLM, so clients see
+    first-token latency instead of full-generation latency. Each event
+    is a JSON object: {"token": "..."} followed by a final
+    {"done": true, "conversation_id": "..."}.
+    """
+    from app.graphs.supervisor_graph import supervisor
+
+    conversation_id = request.conversation_id or str(uuid.uuid4())
+
+    log.info(
+        "Streaming agent invocation requested",
+        message_length=len(request.message),
+        user_id=request.user_id,
+    )
+
+    async def event_stream():
+        try:
+            async for token in supervisor.execute_stream(request.message):
+                yield f"data: {json.dumps({'token': token})}\n\n"
+            yield f"data: {json.dumps({'done': True, 'conversation_id': conversation_id})}\n\n"
+        except Exception as e:
+            log.error("Streaming invocation failed", exc_info=e)
+            yield f"data: {json.dumps({'error': str(e)[:200]})}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.get(
     "/status",
     status_code=status.HTTP_200_OK,
@@ -104,18 +142,11 @@ async def invoke_agents(request: AgentInvokeRequest):
 )
 async def agent_status():
     """Get agent system status."""
-    from app.graphs.supervisor_graph import (
-        supervisor,
-        data_ingestion_agent,
-        analysis_agent,
-        query_agent,
-    )
-    
+    from app.agents import get_agent
+
     agents = [
-        {"name": "supervisor", "status": "ready", "temperature": supervisor.temperature},
-        {"name": "data_ingestion_agent", "status": "ready", "temperature": data_ingestion_agent.temperature},
-        {"name": "analysis_agent", "status": "ready", "temperature": analysis_agent.temperature},
-        {"name": "query_agent", "status": "ready", "temperature": query_agent.temperature},
+        {"name": name, "status": "ready", "temperature": get_agent(name).temperature}
+        for name in ("supervisor", "data_ingestion_agent", "analysis_agent", "query_agent")
     ]
     
     return {
@@ -6,43 +6,51 @@ Conversation Management Endpoints
 Provides REST API for managing conversation history.
 """
 
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel, Field
-from sqlalchemy import desc, select
+from sqlalchemy import delete, desc, func, select
+from sqlalchemy.orm import noload, raiseload
 
 from app.db.models import Conversation, AgentExecution
 from app.db.postgres import get_db_session
+from app.db.redis_cache import cache
 from app.utils.logger import get_logger
 
 log = get_logger(__name__)
 
 router = APIRouter(prefix="/conversations", tags=["Conversations"])
 
+# Read-path responses are served from Redis for this long; DELETE
+# invalidates eagerly, so the TTL only bounds staleness from writes
+# that happen outside this API
+RESPONSE_CACHE_TTL = 60
+
 
 # =============================================================================
 # RESPONSE MODELS
 # =============================================================================
 class ConversationSummary(BaseModel):
     """Summary of a conversation."""
-    
+
     id: str
     title: str
     user_id: Optional[str]
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
     message_count: int
 
 
 class ConversationDetail(BaseModel):
     """Detailed conversation with execution history."""
-    
+
     id: str
     title: str
     user_id: Optional[str]
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
     metadata: Optional[dict]
     executions: list[dict]
 
@@ -73,10 +81,16 @@ async def list_conversations(
     Returns:
         List of conversation summaries
     """
+    cache_key = f"conv:list:{user_id}:{limit}:{offset}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     async with get_db_session() as db:
-        # Build query
-        query = select(Conversation)
-        
+        # Build query — counts come from the grouped query below, so
+        # skip the relationship's default selectin load entirely
+        query = select(Conversation).options(noload(Conversation.agent_executions))
+
         if user_id:
             query = query.where(Conversation.user_id == user_id)
         
@@ -85,33 +99,44 @@ async def list_conversations(
         # Execute query
         result = await db.execute(query)
         conversations = result.scalars().all()
-        
-        # Get execution counts
-        summaries = []
-        for conv in conversations:
-            count_query = select(AgentExecution).where(
-                AgentExecution.conversation_id == conv.id
+
+        # Get execution counts in one grouped query (a per-conversation
+        # SELECT here was N+1 round trips just to count rows)
+        counts: dict[str, int] = {}
+        if conversations:
+            conversation_ids = [conv.id for conv in conversations]
+            count_query = (
+                select(AgentExecution.conversation_id, func.count().label("c"))
+                .where(AgentExecution.conversation_id.in_(conversation_ids))
+                .group_by(AgentExecution.conversation_id)
             )
             count_result = await db.execute(count_query)
-            execution_count = len(count_result.scalars().all())
-            
-            summaries.append(
-                ConversationSummary(
-                    id=conv.id,
-                    title=conv.title,
-                    user_id=conv.user_id,
-                    created_at=conv.created_at.isoformat(),
-                    updated_at=conv.updated_at.isoformat(),
-                    message_count=execution_count,
-                )
+            counts = {row[0]: row[1] for row in count_result}
+
+        summaries = [
+            ConversationSummary(
+                id=conv.id,
+                title=conv.title,
+                user_id=conv.user_id,
+                created_at=conv.created_at,
+                updated_at=conv.updated_at,
+                message_count=counts.get(conv.id, 0),
             )
+            for conv in conversations
+        ]
         
         log.info(
             "Listed conversations",
             count=len(summaries),
             user_id=user_id,
         )
-        
+
+        await cache.set(
+            cache_key,
+            [summary.model_dump(mode="json") for summary in summaries],
+            ttl=RESPONSE_CACHE_TTL,
+        )
+
         return summaries
 
 
@@ -122,52 +147,79 @@ async def list_conversations(
     summary="Get conversation details",
     description="Get detailed conversation with execution history",
 )
-async def get_conversation(conversation_id: str):
+async def get_conversation(
+    conversation_id: str,
+    exec_limit: int = Query(100, ge=1, le=1000, description="Max executions to return"),
+    exec_after: Optional[int] = Query(None, description="Return executions with ID greater than this (cursor)"),
+):
     """
-    Get conversation details.
-    
+    Get conversation details with a bounded page of executions.
+
     Args:
         conversation_id: Conversation identifier
-    
+        exec_limit: Maximum number of executions to include
+        exec_after: Cursor — only executions with an ID past this one
+
     Returns:
         Detailed conversation information
-    
+
     Raises:
         HTTPException: If conversation not found
     """
+    cache_key = f"conv:detail:{conversation_id}:{exec_limit}:{exec_after}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     async with get_db_session() as db:
-        # Get conversation
-        query = select(Conversation).where(Conversation.id == conversation_id)
+        query = (
+            select(Conversation)
+            .where(Conversation.id == conversation_id)
+            # raiseload turns any accidental lazy load into an error
+            # instead of a silent N+1 regression
+            .options(raiseload("*"))
+        )
         result = await db.execute(query)
         conversation = result.scalar_one_or_none()
-        
+
         if not conversation:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Conversation {conversation_id} not found",
             )
-        
-        # Get executions
-        exec_query = select(AgentExecution).where(
-            AgentExecution.conversation_id == conversation_id
-        ).order_by(AgentExecution.started_at)
-        exec_result = await db.execute(exec_query)
-        executions = exec_result.scalars().all()
-        
-        # Format executions
-        execution_list = [
-            {
-                "id": exec.id,
-                "agent_name": exec.agent_name,
-                "agent_type": exec.agent_type,
-                "status": exec.status,
-                "started_at": exec.started_at.isoformat(),
-                "completed_at": exec.completed_at.isoformat() if exec.completed_at else None,
-                "duration_ms": exec.duration_ms,
-                "tokens_used": exec.tokens_used,
-            }
-            for exec in executions
-        ]
+
+        # Page through executions server-side instead of materializing
+        # the whole history: long conversations previously caused O(N)
+        # memory spikes here. db.stream keeps peak memory at one row
+        # while the page is built.
+        exec_query = (
+            select(AgentExecution)
+            .where(AgentExecution.conversation_id == conversation_id)
+            .order_by(AgentExecution.started_at, AgentExecution.id)
+            .limit(exec_limit)
+            # Fetch in server-side batches so the driver never buffers
+            # the whole page at once
+            .execution_options(yield_per=100)
+        )
+        if exec_after is not None:
+            exec_query = exec_query.where(AgentExecution.id > exec_after)
+
+        exec_result = await db.stream(exec_query)
+
+        execution_list = []
+        async for exec in exec_result.scalars():
+            execution_list.append(
+                {
+                    "id": exec.id,
+                    "agent_name": exec.agent_name,
+                    "agent_type": exec.agent_type,
+                    "status": exec.status,
+                    "started_at": exec.started_at,
+                    "completed_at": exec.completed_at,
+                    "duration_ms": exec.duration_ms,
+                    "tokens_used": exec.tokens_used,
+                }
+            )
         
         log.info(
             "Retrieved conversation",
@@ -175,16 +227,20 @@ async def get_conversation(conversation_id: str):
             execution_count=len(execution_list),
         )
         
-        return ConversationDetail(
+        detail = ConversationDetail(
             id=conversation.id,
             title=conversation.title,
             user_id=conversation.user_id,
-            created_at=conversation.created_at.isoformat(),
-            updated_at=conversation.updated_at.isoformat(),
-            metadata=conversation.metadata,
+            created_at=conversation.created_at,
+            updated_at=conversation.updated_at,
+            metadata=conversation.context_data,
             executions=execution_list,
         )
 
+        await cache.set(cache_key, detail.model_dump(mode="json"), ttl=RESPONSE_CACHE_TTL)
+
+        return detail
+
 
 @router.delete(
     "/{conversation_id}",
@@ -203,19 +259,26 @@ async def delete_conversation(conversation_id: str):
         HTTPException: If conversation not found
     """
     async with get_db_session() as db:
-        # Get conversation
-        query = select(Conversation).where(Conversation.id == conversation_id)
-        result = await db.execute(query)
-        conversation = result.scalar_one_or_none()
-        
-        if not conversation:
+        # Bulk DELETE children then parent in one transaction: the ORM
+        # cascade path first SELECTed the row, then issued per-child
+        # deletes — N+1 round trips for long conversations
+        await db.execute(
+            delete(AgentExecution).where(AgentExecution.conversation_id == conversation_id)
+        )
+        result = await db.execute(
+            delete(Conversation).where(Conversation.id == conversation_id)
+        )
+
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Conversation {conversation_id} not found",
             )
-        
-        # Delete (cascade will delete executions)
-        await db.delete(conversation)
+
         await db.commit()
-        
+
+        # Drop stale cached reads: every list page and this detail view
+        await cache.delete_pattern("conv:list:*")
+        await cache.delete_pattern(f"conv:detail:{conversation_id}:*")
+
         log.info("Deleted conversation", conversation_id=conversation_id)
\ No newline at end of file
@@ -6,11 +6,16 @@ Health Check Endpoints
 Provides health status for monitoring, load balancers, and uptime checks.
 """
 
-from fastapi import APIRouter, status
+import asyncio
+import time
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, Response, status
 from pydantic import BaseModel
 
 from app.config import settings
-from app.db.postgres import check_database_connection
+from app.db.postgres import check_database_connection, is_pool_healthy
 from app.db.redis_cache import cache
 from app.utils.logger import get_logger
 
@@ -18,14 +23,78 @@ log = get_logger(__name__)
 
 router = APIRouter(tags=["Health"])
 
+# How long a database probe result stays valid. Kubernetes and load
+# balancers hit these endpoints every few seconds per node; without a
+# short memo each probe is a real PostgreSQL round trip.
+DB_CHECK_TTL_SECONDS = 2.0
+
+_last_check: Optional[tuple[float, bool]] = None
+_check_lock = asyncio.Lock()
+
+
+async def cached_db_check() -> bool:
+    """
+    Check database connectivity, memoized for a couple of seconds.
+
+    The lock coalesces concurrent probes so a burst results in a single
+    SELECT 1 rather than one per caller.
+    """
+    global _last_check
+
+    now = time.monotonic()
+    if _last_check and now - _last_check[0] < DB_CHECK_TTL_SECONDS:
+        return _last_check[1]
+
+    async with _check_lock:
+        # Another probe may have refreshed while we waited for the lock
+        now = time.monotonic()
+        if _last_check and now - _last_check[0] < DB_CHECK_TTL_SECONDS:
+            return _last_check[1]
+
+        ok = await check_database_connection()
+        _last_check = (time.monotonic(), ok)
+        return ok
+
 
 class HealthResponse(BaseModel):
-    """Health check response model."""
+    """Health check response model (kept for the OpenAPI schema)."""
     status: str
     environment: str
     version: str
     database: str
     cache: str
+    pool: str
+
+
+# Probe payloads serialized once, not per hit. Load balancers call these
+# endpoints constantly and the bodies only vary by component status, so
+# each variant is encoded exactly once. Fresh Response objects are still
+# built per request — sharing one instance would let middleware header
+# injection mutate the same raw_headers list forever.
+_LIVE_BYTES = orjson.dumps({"status": "alive"})
+_READY_BYTES = orjson.dumps({"status": "ready"})
+_NOT_READY_BYTES = orjson.dumps({"status": "not ready", "reason": "database unavailable"})
+
+_health_variants: dict[tuple[str, str, str], bytes] = {}
+
+
+def _health_body(db_status: str, cache_status: str, pool_status: str) -> bytes:
+    """Pre-serialized health payload for a component-status combination."""
+    key = (db_status, cache_status, pool_status)
+    body = _health_variants.get(key)
+    if body is None:
+        body = orjson.dumps(
+            {
+                "status": "healthy" if db_status == "healthy" else "degraded",
+                "environment": settings.ENVIRONMENT,
+                "version": "0.1.0",
+                "database": db_status,
+                "cache": cache_status,
+                "pool": pool_status,
+            }
+        )
+        _health_variants[key] = body
+    return body
 
 
 @router.get(
@@ -43,17 +112,18 @@ async def health_check():
         Health status with component checks
     """
     # Check database
-    db_status = "healthy" if await check_database_connection() else "unhealthy"
-    
+    db_status = "healthy" if await cached_db_check() else "unhealthy"
+
     # Check cache
     cache_status = "healthy" if cache.redis_client else "unavailable"
-    
-    return HealthResponse(
-        status="healthy" if db_status == "healthy" else "degraded",
-        environment=settings.ENVIRONMENT,
-        version="0.1.0",
-        database=db_status,
-        cache=cache_status,
+
+    # Shallow pool probe (no SQL round trip): "cold" means no pooled
+    # connection is open yet, e.g. right after startup in DEBUG mode
+    pool_status = "warm" if is_pool_healthy() else "cold"
+
+    return Response(
+        content=_health_body(db_status, cache_status, pool_status),
+        media_type="application/json",
     )
 
 
@@ -69,7 +139,7 @@ async def liveness():
     
     Returns 200 if service is running.
     """
-    return {"status": "alive"}
+    return Response(content=_LIVE_BYTES, media_type="application/json")
 
 
 @router.get(
@@ -84,9 +154,9 @@ async def readiness():
     
     Returns 200 if service is ready to handle requests.
     """
-    db_healthy = await check_database_connection()
-    
+    db_healthy = await cached_db_check()
+
     if not db_healthy:
-        return {"status": "not ready", "reason": "database unavailable"}
-    
-    return {"status": "ready"}
\ No newline at end of file
+        return Response(content=_NOT_READY_BYTES, media_type="application/json")
+
+    return Response(content=_READY_BYTES, media_type="application/json")
\ No newline at end of file
@@ -8,17 +8,69 @@ Provides live streaming of agent execution progress.
 
 import asyncio
 import json
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
 from typing import Dict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 
 from app.utils.logger import get_logger
 
+try:
+    from websockets.exceptions import ConnectionClosed
+    # Expected failure modes when a peer goes away mid-send; these are
+    # routine churn, not errors worth a stringified stack trace
+    SEND_FAILURES = (WebSocketDisconnect, ConnectionClosed, RuntimeError)
+except ImportError:
+    SEND_FAILURES = (WebSocketDisconnect, RuntimeError)
+
 log = get_logger(__name__)
 
 router = APIRouter()
 
+# Cap on sockets mid-write at once (file descriptors / pending writes)
+MAX_CONCURRENT_SENDS = 100
+
+# Bounded outbound queue per connection; overflow drops the oldest update
+OUTBOUND_QUEUE_SIZE = 256
+
+_broadcast_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+
+def _decode_message(data: str) -> dict:
+    """
+    Parse an inbound client message.
+
+    orjson.loads is several times faster than stdlib json for the small
+    ping/subscribe messages the receive loop handles, which matters at
+    thousands of messages per second. Raises ValueError on malformed
+    input either way (orjson.JSONDecodeError subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _encode_payload(message: dict) -> str:
+    """
+    Serialize an outbound message once, for all recipients.
+
+    send_json would re-encode the identical dict per client, turning one
+    broadcast into O(N) JSON encodes. orjson (C extension) is preferred
+    when installed; the wire format is unchanged either way.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message).decode()
+    return json.dumps(message)
+
 
 # =============================================================================
 # CONNECTION MANAGER
@@ -32,74 +84,249 @@ class ConnectionManager:
     - Broadcast to all connections
     - Send to specific connection
     - Automatic cleanup on disconnect
+
+    Each connection gets a bounded outbound queue drained by a dedicated
+    writer task, so producers (broadcasts, agent updates) never await a
+    slow socket directly — no head-of-line blocking. When a queue fills,
+    the oldest update is dropped to keep the stream fresh.
     """
-    
+
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
-    
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._writers: Dict[str, asyncio.Task] = {}
+        # Subscription index: conversation_id -> interested client_ids,
+        # so conversation-scoped updates fan out to O(interested) clients
+        # instead of every connection
+        self.rooms: Dict[str, set] = defaultdict(set)
+
     async def connect(self, websocket: WebSocket, client_id: str):
         """
-        Accept new WebSocket connection.
-        
+        Accept new WebSocket connection and start its writer task.
+
         Args:
             websocket: WebSocket instance
             client_id: Unique client identifier
         """
         await websocket.accept()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
         self.active_connections[client_id] = websocket
+        self._queues[client_id] = queue
+        self._writers[client_id] = asyncio.create_task(
+            self._writer(client_id, websocket, queue)
+        )
         log.info("WebSocket connected", client_id=client_id, total_connections=len(self.active_connections))
-    
+
     def disconnect(self, client_id: str):
         """
-        Remove disconnected client.
-        
+        Remove disconnected client and stop its writer task.
+
         Args:
             client_id: Client identifier
         """
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+            self._queues.pop(client_id, None)
+            writer = self._writers.pop(client_id, None)
+            if writer is not None:
+                writer.cancel()
+            # Drop room memberships (and empty rooms) for this client
+            for room_id in list(self.rooms.keys()):
+                self.rooms[room_id].discard(client_id)
+                if not self.rooms[room_id]:
+                    del self.rooms[room_id]
             log.info("WebSocket disconnected", client_id=client_id, total_connections=len(self.active_connections))
-    
+
+    def subscribe(self, client_id: str, conversation_id: str) -> None:
+        """
+        Subscribe a client to updates for one conversation.
+
+        Args:
+            client_id: Client identifier
+            conversation_id: Conversation to follow
+        """
+        self.rooms[conversation_id].add(client_id)
+        log.debug("Client subscribed", client_id=client_id, conversation_id=conversation_id)
+
+    async def _writer(self, client_id: str, websocket: WebSocket, queue: asyncio.Queue):
+        """
+        Drain a client's outbound queue onto its socket.
+
+        Runs as a dedicated task per connection; the global semaphore
+        bounds how many sockets are mid-write at once.
+        """
+        try:
+            while True:
+                payload = await queue.get()
+                async with _broadcast_semaphore:
+                    await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            pass
+        except SEND_FAILURES:
+            # Peer disconnected mid-send — routine churn, log cheaply
+            log.debug("WebSocket send failed, removing connection", client_id=client_id)
+            self.disconnect(client_id)
+        except Exception as e:
+            log.error("WebSocket writer failed", client_id=client_id, exc_info=e)
+            self.disconnect(client_id)
+
+    def _enqueue(self, client_id: str, payload: str) -> None:
+        """Queue a payload for a client, dropping the oldest when full."""
+        queue = self._queues.get(client_id)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # Slow client: sacrifice the oldest update, keep the stream live
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                pass
+
     async def send_personal_message(self, message: dict, client_id: str):
         """
         Send message to specific client.
-        
+
         Args:
             message: Message payload
             client_id: Target client identifier
         """
         if client_id in self.active_connections:
-            websocket = self.active_connections[client_id]
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                log.error("Failed to send message", client_id=client_id, exc_info=e)
-    
+            self._enqueue(client_id, _encode_payload(message))
+
     async def broadcast(self, message: dict):
         """
         Broadcast message to all connected clients.
-        
+
+        Enqueues the (once-encoded) payload onto every client's outbound
+        queue — the caller returns immediately regardless of how slow any
+        individual socket is; the per-client writer tasks handle delivery.
+
         Args:
             message: Message payload
         """
-        disconnected = []
-        
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                log.error("Broadcast failed", client_id=client_id, exc_info=e)
-                disconnected.append(client_id)
-        
-        # Clean up disconnected clients
-        for client_id in disconnected:
-            self.disconnect(client_id)
+        if not self.active_connections:
+            return
+
+        # One encode shared by every recipient
+        payload = _encode_payload(message)
+
+        for client_id in list(self._queues.keys()):
+            self._enqueue(client_id, payload)
+
+    async def broadcast_to_room(self, room: str, message: dict):
+        """
+        Broadcast message to clients subscribed to a conversation.
+
+        Args:
+            room: Conversation identifier
+            message: Message payload
+        """
+        members = self.rooms.get(room)
+        if not members:
+            return
+
+        payload = _encode_payload(message)
+
+        for client_id in list(members):
+            self._enqueue(client_id, payload)
 
 
 # Global connection manager instance
 manager = ConnectionManager()
 
 
+# =============================================================================
+# REDIS PUB/SUB FAN-OUT (multi-worker deployments)
+# =============================================================================
+# `manager` is per-process: under multiple uvicorn workers a broadcast from
+# one worker would only reach that worker's clients. Updates are therefore
+# published to a Redis channel and every worker subscribes once, re-emitting
+# each message to its own local connections.
+
+PUBSUB_CHANNEL = "agent_updates"
+
+_pubsub_task: asyncio.Task = None
+
+
+async def _pubsub_listener():
+    """Subscribe to the update channel and re-broadcast locally."""
+    from app.db.redis_cache import cache
+
+    pubsub = cache.redis_client.pubsub()
+    await pubsub.subscribe(PUBSUB_CHANNEL)
+    log.info("Subscribed to agent update channel", channel=PUBSUB_CHANNEL)
+
+    try:
+        async for msg in pubsub.listen():
+            if msg["type"] != "message":
+                continue
+            try:
+                envelope = _decode_message(msg["data"])
+            except (ValueError, TypeError):
+                log.warning("Malformed pub/sub payload dropped")
+                continue
+            await _deliver_local(envelope.get("message", {}), envelope.get("conversation_id"))
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await pubsub.unsubscribe(PUBSUB_CHANNEL)
+        await pubsub.close()
+
+
+async def start_pubsub_listener():
+    """Start the pub/sub listener task. Call at application startup."""
+    global _pubsub_task
+    from app.db.redis_cache import cache
+
+    if cache.redis_client is None:
+        log.info("Redis unavailable, agent updates stay process-local")
+        return
+    _pubsub_task = asyncio.create_task(_pubsub_listener())
+
+
+async def stop_pubsub_listener():
+    """Stop the pub/sub listener task. Call at application shutdown."""
+    global _pubsub_task
+    if _pubsub_task is not None:
+        _pubsub_task.cancel()
+        try:
+            await _pubsub_task
+        except asyncio.CancelledError:
+            pass
+        _pubsub_task = None
+
+
+async def _deliver_local(message: dict, conversation_id: str = None):
+    """Hand a message to this worker's connections."""
+    if conversation_id:
+        await manager.broadcast_to_room(conversation_id, message)
+    else:
+        await manager.broadcast(message)
+
+
+async def _publish_update(message: dict, conversation_id: str = None):
+    """
+    Fan an update out across workers via Redis, or locally as a fallback.
+    """
+    from app.db.redis_cache import cache
+
+    if cache.redis_client is not None:
+        envelope = {"conversation_id": conversation_id, "message": message}
+        try:
+            await cache.redis_client.publish(PUBSUB_CHANNEL, _encode_payload(envelope))
+            return
+        except Exception as e:
+            log.warning("Pub/sub publish failed, broadcasting locally", exc_info=e)
+
+    await _deliver_local(message, conversation_id)
+
+
 # =============================================================================
 # WEBSOCKET ENDPOINT
 # =============================================================================
@@ -147,8 +374,8 @@ async def agent_updates_websocket(websocket: WebSocket, client_id: str):
                 
                 # Parse message
                 try:
-                    message = json.loads(data)
-                except json.JSONDecodeError:
+                    message = _decode_message(data)
+                except ValueError:
                     await manager.send_personal_message(
                         {
                             "type": "error",
@@ -174,6 +401,8 @@ async def agent_updates_websocket(websocket: WebSocket, client_id: str):
                 elif message_type == "subscribe":
                     # Subscribe to specific conversation updates
                     conversation_id = message.get("conversation_id")
+                    if conversation_id:
+                        manager.subscribe(client_id, conversation_id)
                     await manager.send_personal_message(
                         {
                             "type": "subscribed",
@@ -198,6 +427,24 @@ async def agent_updates_websocket(websocket: WebSocket, client_id: str):
 # =============================================================================
 # HELPER FUNCTIONS FOR SENDING UPDATES
 # =============================================================================
+
+# Second-resolution timestamp cache: at high message rates the
+# datetime.utcnow().isoformat() pair dominated these helpers' CPU, and
+# within the same wall-clock second every message gets the same string
+_ts_cache: tuple = (0, "")
+
+
+def now_iso() -> str:
+    """Return the current UTC timestamp in ISO format, cached per second."""
+    global _ts_cache
+    s = int(time.time())
+    if _ts_cache[0] == s:
+        return _ts_cache[1]
+    iso = datetime.fromtimestamp(s, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    _ts_cache = (s, iso)
+    return iso
+
+
 async def send_agent_update(
     client_id: str,
     update_type: str,
@@ -213,15 +460,13 @@ async def send_agent_update(
         agent_name: Name of agent
         data: Update payload
     """
-    from datetime import datetime
-    
     message = {
         "type": update_type,
         "agent_name": agent_name,
         "data": data,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now_iso(),
     }
-    
+
     await manager.send_personal_message(message, client_id)
 
 
@@ -229,22 +474,27 @@ async def broadcast_agent_update(
     update_type: str,
     agent_name: str,
     data: dict,
+    conversation_id: str = None,
 ):
     """
-    Broadcast agent update to all connected clients.
-    
+    Broadcast agent update to interested clients across all workers.
+
+    When a conversation_id is given the update goes only to clients
+    subscribed to that conversation; otherwise it goes to everyone.
+    Delivery goes through Redis pub/sub when available so clients on
+    other uvicorn workers receive the update too.
+
     Args:
         update_type: Type of update
         agent_name: Name of agent
         data: Update payload
+        conversation_id: Optional conversation to scope the update to
     """
-    from datetime import datetime
-    
     message = {
         "type": update_type,
         "agent_name": agent_name,
         "data": data,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now_iso(),
     }
-    
-    await manager.broadcast(message)
\ No newline at end of file
+
+    await _publish_update(message, conversation_id)
\ No newline at end of file
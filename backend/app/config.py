@@ -16,7 +16,7 @@ Key Features:
 """
 
 import os
-from functools import lru_cache
+from functools import cache, cached_property
 from typing import Literal, Optional
 
 from pydantic import Field, PostgresDsn, RedisDsn, field_validator
@@ -95,8 +95,41 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = Field(..., description="Database password")
     POSTGRES_SSL_MODE: str = Field(default="require", description="SSL mode")
 
+    # Connection pool tuning. The SQLAlchemy default pool of 5 starves
+    # under FastAPI concurrency; these defaults absorb ~60 concurrent
+    # DB-touching requests before queueing.
+    POSTGRES_POOL_SIZE: int = Field(
+        default=20,
+        description="Connections kept open in the SQLAlchemy pool"
+    )
+    POSTGRES_MAX_OVERFLOW: int = Field(
+        default=40,
+        description="Extra connections allowed beyond POSTGRES_POOL_SIZE"
+    )
+    POSTGRES_POOL_TIMEOUT: int = Field(
+        default=30,
+        description="Seconds to wait for a pooled connection before erroring"
+    )
+    POSTGRES_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Recycle pooled connections after N seconds (30 minutes)"
+    )
+    POSTGRES_POOL_PRE_PING: bool = Field(
+        default=False,
+        description="Validate pooled connections with SELECT 1 on every checkout "
+                    "(adds a round-trip per checkout; pool_recycle plus the "
+                    "startup warm-up normally makes this unnecessary)"
+    )
+    PGBOUNCER_MODE: bool = Field(
+        default=False,
+        description="Set when connecting through pgbouncer transaction pooling "
+                    "(disables prepared-statement caching and client-side pooling)"
+    )
+
     # Computed database URL for SQLAlchemy
-    @property
+    # cached_property: built once, then a plain attribute lookup on hot
+    # request paths instead of an f-string build per access
+    @cached_property
     def DATABASE_URL(self) -> str:
         """
         Constructs async PostgreSQL connection string.
@@ -122,7 +155,7 @@ class Settings(BaseSettings):
     REDIS_DB: str = Field(..., description="Redis database")
     REDIS_SSL: bool = Field(default=False, description="Use SSL for Redis")
 
-    @property
+    @cached_property
     def REDIS_URL(self) -> str:
         """
         Constructs Redis connection string.
@@ -133,11 +166,19 @@ class Settings(BaseSettings):
         return f"{protocol}://{auth}{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
 
     ENABLE_CACHE: bool = Field(default=True, description="Enable Redis caching")
+    LOCAL_CACHE_MAX: int = Field(
+        default=1024,
+        description="Max entries in the in-memory fallback cache"
+    )
     CACHE_TTL: int = Field(default=3600, description="Cache TTL in seconds (1 hour)")
     CACHE_HOT_RELOAD_INTERVAL: int = Field(
         default=300,
         description="Interval to reload cache from PostgreSQL (5 minutes)"
     )
+    SEMANTIC_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Enable the in-process semantic LLM response cache"
+    )
 
 
     #---------------------------- Vector Database Settings -----------------------------
@@ -146,7 +187,7 @@ class Settings(BaseSettings):
     # - Document embeddings
     # - Conversation context retrieval
 
-    VECTOR_DB_TYPE: Literal["pinecone", "chromadb"] = Field(
+    VECTOR_DB_TYPE: Literal["pinecone", "chromadb", "pgvector"] = Field(
         default="pinecone",
         description="Vector database type"
     )
@@ -161,6 +202,20 @@ class Settings(BaseSettings):
     CHROMA_PORT: Optional[int] = Field(default=8000)
     CHROMA_COLLECTION_NAME: Optional[str] = Field(default="agent_embeddings")
 
+    # Embedding settings
+    EMBED_CONCURRENCY: int = Field(
+        default=4,
+        description="Max concurrent embedding requests to the provider"
+    )
+    EMBEDDING_DEVICE: str = Field(
+        default="auto",
+        description="Device for local embeddings: auto, cpu, cuda, or mps"
+    )
+    EMBEDDING_BACKEND: Literal["torch", "onnx"] = Field(
+        default="torch",
+        description="sentence-transformers backend (onnx is 2-4x faster on CPU)"
+    )
+
 
     #------------------------ Security Settings ---------------------------------------
 
@@ -185,7 +240,7 @@ class Settings(BaseSettings):
         description="Comma-seperated list of allowed CORS origins"
     )
 
-    @property
+    @cached_property
     def CORS_ORIGINS_LIST(self) -> list[str]:
         """Convert comman-seperated CORS origins to list."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
@@ -210,6 +265,14 @@ class Settings(BaseSettings):
         default="llama-3.3-70b-versatile",
         description="LLM model for supervisor agent"
     )
+    AGENT_POOL_SIZE: int = Field(
+        default=4,
+        description="Max pooled instances per worker agent type"
+    )
+    MAX_HISTORY_TOKENS: int = Field(
+        default=2000,
+        description="Token budget for conversation history sent to LLM calls"
+    )
 
 
     #------------------------- Logging Settings ---------------------------------------
@@ -238,13 +301,14 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """
     Create and cache settings instance.
 
-    Using @lru_cache ensures settings are loaded only once and reused
-    across the application, imporoving the performance.
+    Using @cache ensures settings are loaded only once and reused
+    across the application (same semantics as lru_cache for a no-arg
+    function, without the bookkeeping layer).
 
     Returns:
         Settings: Cached settings instance
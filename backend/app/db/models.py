@@ -19,7 +19,8 @@ from typing import Optional
 from uuid import uuid4
 
 import sqlalchemy
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.postgres import Base
@@ -87,10 +88,11 @@ class Conversation(Base):
         comment="Last update timestamp"
     )
     
-    # JSON metadata for flexible storage
+    # JSONB metadata for flexible storage (binary representation — no
+    # text reparse on read, containment queries are indexable)
     # NOTE: 'metadata' is a reserved name in SQLAlchemy, so we use 'context_data'
     context_data: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Additional conversation context (preferences, tags, etc.)"
     )
@@ -100,6 +102,9 @@ class Conversation(Base):
         "AgentExecution",
         back_populates="conversation",
         cascade="all, delete-orphan",  # Delete executions when conversation is deleted
+        passive_deletes=True,  # Let ON DELETE CASCADE do it — don't load children first
+        lazy="selectin",  # One IN-list query per batch of parents, never N+1 (async-safe)
+        order_by="AgentExecution.started_at",  # Chronological for history views
     )
     
     def __repr__(self) -> str:
@@ -127,7 +132,24 @@ class AgentExecution(Base):
     - Cost tracking (LLM token usage)
     """
     __tablename__ = "agent_executions"
-    
+
+    # Composite btree indexes match the natural access patterns
+    # ("executions in a conversation, in order", "recent runs of an
+    # agent", "recent failures") so those queries avoid heap sorts.
+    # GIN + jsonb_path_ops: indexes containment (@>) lookups on agent
+    # inputs with a much smaller index than the default jsonb_ops
+    __table_args__ = (
+        Index("ix_ae_conv_started", "conversation_id", "started_at"),
+        Index("ix_ae_agent_started", "agent_name", "started_at"),
+        Index("ix_ae_status_started", "status", "started_at"),
+        Index(
+            "ix_agent_executions_input_gin",
+            "input_data",
+            postgresql_using="gin",
+            postgresql_ops={"input_data": "jsonb_path_ops"},
+        ),
+    )
+
     # Primary key
     id: Mapped[int] = mapped_column(
         Integer,
@@ -141,15 +163,15 @@ class AgentExecution(Base):
         String(36),
         ForeignKey("conversations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,  # Index for faster joins
+        # Covered by the leading column of ix_ae_conv_started
         comment="Parent conversation ID",
     )
-    
+
     # Agent information
     agent_name: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
-        index=True,  # Index for querying by agent
+        # Covered by the leading column of ix_ae_agent_started
         comment="Name of the agent that executed this task"
     )
     
@@ -161,13 +183,13 @@ class AgentExecution(Base):
     
     # Execution data
     input_data: Mapped[dict] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
         comment="Input provided to the agent",
     )
-    
+
     output_data: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Output/result from the agent",
     )
@@ -216,7 +238,7 @@ class AgentExecution(Base):
     # Execution metadata
     # NOTE: 'metadata' is a reserved name in SQLAlchemy, so we use 'execution_metadata'
     execution_metadata: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Additional execution metadata (model used, temperature, etc.)"
     )
@@ -224,7 +246,9 @@ class AgentExecution(Base):
     # Relationship: Many executions belong to one conversation
     conversation: Mapped["Conversation"] = relationship(
         "Conversation",
-        back_populates="agent_executions"
+        back_populates="agent_executions",
+        lazy="joined",  # Many-to-one: a single JOIN is near-free
+        innerjoin=True,  # conversation_id is NOT NULL, so inner join is safe
     )
     
     def __repr__(self) -> str:
@@ -180,6 +180,7 @@ Key Concepts:
 - Connection pooling: Reuses connections for better performance
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -191,7 +192,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.config import settings
 from app.utils.logger import get_logger
@@ -223,54 +224,85 @@ class Base(DeclarativeBase):
 def create_database_engine() -> AsyncEngine:
     """
     Create async PostgreSQL engine with connection pooling.
-    
-    Connection Pool Settings:
-    - pool_size: Number of connections to keep open (default: 5)
-    - max_overflow: Additional connections beyond pool_size (default: 10)
+
+    Connection Pool Settings (from Settings, see POSTGRES_POOL_*):
+    - pool_size: Number of connections to keep open
+    - max_overflow: Additional connections beyond pool_size
     - pool_pre_ping: Check connection health before using (prevents stale connections)
     - pool_recycle: Recycle connections after N seconds (prevents timeout)
     - echo: Log all SQL statements (useful for debugging)
-    
+
     Returns:
         AsyncEngine: Configured async database engine
     """
-    
+
     # Development: Use NullPool for easier debugging (no connection reuse)
-    # Production: Use QueuePool for better performance
-    poolclass = NullPool if settings.DEBUG else QueuePool
-    
+    # pgbouncer transaction pooling: NullPool too — pgbouncer is the pool,
+    # and prepared statements don't survive connection reassignment
+    # Production: AsyncAdaptedQueuePool — the async-safe queue pool that
+    # create_async_engine expects (plain QueuePool can block the event loop)
+    poolclass = NullPool if (settings.DEBUG or settings.PGBOUNCER_MODE) else AsyncAdaptedQueuePool
+
     # NullPool doesn't accept pool_size, max_overflow, pool_pre_ping, or pool_recycle
-    # These parameters only work with QueuePool
+    # These parameters only work with the queue pool
     if poolclass == NullPool:
+        connect_args = {}
+        if settings.PGBOUNCER_MODE:
+            # Statement names would collide across pgbouncer-multiplexed
+            # sessions; disable the cache entirely
+            connect_args["prepared_statement_cache_size"] = 0
+
         engine = create_async_engine(
             settings.DATABASE_URL,
             echo=settings.DEBUG,  # Log SQL in debug mode
             poolclass=poolclass,
+            connect_args=connect_args,
+            query_cache_size=1200,  # Compiled-SQL cache (default 500)
         )
-        
+
         log.info(
             "Database engine created",
             pool_class=poolclass.__name__,
             pool_size=0,
+            pgbouncer_mode=settings.PGBOUNCER_MODE,
         )
-    
+
     else:
         engine = create_async_engine(
             settings.DATABASE_URL,
             echo=settings.DEBUG,  # Log SQL in debug mode
             poolclass=poolclass,
-            pool_size=5,  # Keep 5 connections open
-            max_overflow=10,  # Allow up to 15 total connections (5+10)
-            pool_pre_ping=True,  # Verify connections are alive
-            pool_recycle=3600,  # Recycle connections after 1 hour
+            pool_size=settings.POSTGRES_POOL_SIZE,
+            max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+            pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+            # Off by default: per-checkout SELECT 1 costs a round-trip on
+            # every session; pool_recycle retires stale connections and
+            # the startup warm-up opens fresh ones
+            pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+            pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+            connect_args={
+                # jit=off skips PostgreSQL's JIT warm-up per new
+                # connection — a net loss for small OLTP queries
+                "server_settings": {"jit": "off"},
+                # Bound any single statement instead of hanging a
+                # pooled connection indefinitely
+                "command_timeout": 30,
+                # Reuse prepared statements across a connection so hot
+                # repeated ORM queries skip parse/plan on the server
+                "prepared_statement_cache_size": 1024,
+            },
+            # Compiled-SQL cache: default 500 entries can thrash once the
+            # ORM query variety grows; misses re-pay compilation CPU
+            query_cache_size=1200,
         )
-        
+
         log.info(
             "Database engine created",
             pool_class=poolclass.__name__,
-            pool_size=5,
+            pool_size=settings.POSTGRES_POOL_SIZE,
+            max_overflow=settings.POSTGRES_MAX_OVERFLOW,
         )
-    
+
     return engine
 
 
@@ -357,6 +389,57 @@ async def init_database() -> None:
     log.info("Database tables created/verified")
 
 
+async def warm_connection_pool() -> None:
+    """
+    Open the configured number of pooled connections up front.
+
+    The pool is lazy by default, so the first POSTGRES_POOL_SIZE requests
+    after startup would each pay TLS + auth handshake latency. Acquiring
+    and releasing that many connections concurrently moves the cost to
+    startup. No-op in DEBUG mode (NullPool keeps nothing open).
+    """
+    if settings.DEBUG:
+        return
+
+    barrier = asyncio.Barrier(settings.POSTGRES_POOL_SIZE)
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            # Hold until all peers have connected, so the pool actually
+            # opens pool_size sockets instead of reusing one
+            await barrier.wait()
+
+    # Failure handling: if any ping fails before reaching the barrier,
+    # the surviving tasks would wait on it forever while holding their
+    # connections — permanently exhausting the base pool. The timeout
+    # bounds that wait, and the explicit cancel releases every held
+    # connection (cancelling a barrier waiter unwinds its `async with`).
+    tasks = [
+        asyncio.create_task(_ping())
+        for _ in range(settings.POSTGRES_POOL_SIZE)
+    ]
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*tasks),
+            timeout=settings.POSTGRES_POOL_TIMEOUT,
+        )
+        # pool.status() gives operators the effective checked-in/out
+        # numbers for tuning POSTGRES_POOL_SIZE/POSTGRES_MAX_OVERFLOW
+        log.info(
+            "Connection pool warmed",
+            pool_size=settings.POSTGRES_POOL_SIZE,
+            max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+            pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+            pool_status=engine.pool.status(),
+        )
+    except Exception as e:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        log.warning("Connection pool warm-up failed", exc_info=e)
+
+
 async def check_database_connection() -> bool:
     """
     Check if database connection is working.
@@ -365,9 +448,10 @@ async def check_database_connection() -> bool:
         bool: True if connection is healthy, False otherwise
     """
     try:
-        async with engine.begin() as conn:
-            result = await conn.execute(text("SELECT 1"))
-            result.scalar()
+        # connect(), not begin(): a health probe has no business opening
+        # a write transaction, and exec_driver_sql skips SQL compilation
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
         log.info("Database connection verified")
         return True
     except Exception as e:
@@ -375,6 +459,21 @@ async def check_database_connection() -> bool:
         return False
 
 
+def is_pool_healthy() -> bool:
+    """
+    Shallow pool-level health probe — no PostgreSQL round trip.
+
+    True when the pool holds at least one connection (checked in or
+    out). Suitable for high-frequency probes where the SQL check in
+    check_database_connection would be overkill.
+    """
+    try:
+        pool = engine.pool
+        return (pool.checkedin() + pool.checkedout()) > 0
+    except Exception:
+        return False
+
+
 async def close_database() -> None:
     """
     Close all database connections.
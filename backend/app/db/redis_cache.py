@@ -18,16 +18,119 @@ Cache Strategy:
 
 import asyncio
 import json
-from typing import Any, Optional
+import random
+import time
+from datetime import datetime, timezone
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 from app.config import settings
 from app.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Stored values are prefixed with a 1-byte format tag so the wire
+# format can evolve without invalidating existing entries (untagged
+# legacy values still parse as plain JSON)
+_FMT_JSON = b"\x01"
+_FMT_MSGPACK = b"\x02"
+
+# Above this size msgpack's binary field encoding beats JSON's repeated
+# quoted keys enough to be worth the second serialization pass
+LARGE_VALUE_THRESHOLD = 4096
+
+
+def _json_dumps(value: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def _json_loads(raw: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache value with a format tag prefix."""
+    payload = _json_dumps(value)
+    if MSGPACK_AVAILABLE and len(payload) > LARGE_VALUE_THRESHOLD:
+        return _FMT_MSGPACK + msgpack.packb(value)
+    return _FMT_JSON + payload
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize a cached value, honoring its format tag."""
+    tag = raw[:1]
+    if tag == _FMT_MSGPACK:
+        return msgpack.unpackb(raw[1:])
+    if tag == _FMT_JSON:
+        return _json_loads(raw[1:])
+    # Untagged entry written before format tags existed
+    return _json_loads(raw)
+
+
+# =============================================================================
+# IN-MEMORY FALLBACK
+# =============================================================================
+class _LocalTTLCache:
+    """
+    Bounded LRU with per-entry TTL for the in-memory fallback.
+
+    The previous plain dict grew without limit and never expired
+    entries, so a long-running process without Redis would OOM. This
+    keeps parity with Redis SETEX semantics at a fixed memory ceiling.
+    """
+
+    def __init__(self, maxsize: int, default_ttl: int):
+        self._maxsize = maxsize
+        self._default_ttl = default_ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = ttl or self._default_ttl
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else default
+
+    def keys(self) -> list[str]:
+        return list(self._data.keys())
+
+    def clear(self) -> None:
+        self._data.clear()
+
 
 # =============================================================================
 # REDIS CONNECTION MANAGEMENT
@@ -46,8 +149,17 @@ class RedisCache:
     
     def __init__(self):
         self.redis_client: Optional[Redis] = None
-        self._local_cache: dict[str, Any] = {}  # Fallback in-memory cache
+        # Fallback in-memory cache: bounded LRU with Redis-like TTLs
+        self._local_cache = _LocalTTLCache(
+            maxsize=settings.LOCAL_CACHE_MAX,
+            default_ttl=settings.CACHE_TTL,
+        )
         self._hot_reload_task: Optional[asyncio.Task] = None
+        # In-flight loads keyed by cache key, for single-flight misses
+        self._inflight: dict[str, asyncio.Future] = {}
+        # Watermark of the last successful hot reload, used to skip
+        # reload cycles when nothing has changed
+        self._last_reload_at: Optional[datetime] = None
     
     async def connect(self) -> None:
         """
@@ -63,7 +175,9 @@ class RedisCache:
             self.redis_client = redis.from_url(
                 settings.REDIS_URL,
                 encoding="utf-8",
-                decode_responses=True,
+                # Keep raw bytes: the JSON parsers accept bytes directly,
+                # so decoding to str first would be a wasted copy per read
+                decode_responses=False,
                 max_connections=10,  # Connection pool size
             )
             
@@ -114,7 +228,7 @@ class RedisCache:
             if self.redis_client:
                 value = await self.redis_client.get(key)
                 if value:
-                    return json.loads(value)
+                    return _loads(value)
             else:
                 # Fallback to in-memory cache
                 return self._local_cache.get(key)
@@ -143,13 +257,12 @@ class RedisCache:
         ttl = ttl or settings.CACHE_TTL
         
         try:
-            serialized = json.dumps(value)
-            
+            serialized = _dumps(value)
+
             if self.redis_client:
                 await self.redis_client.setex(key, ttl, serialized)
             else:
-                # Fallback to in-memory cache (no TTL in fallback)
-                self._local_cache[key] = value
+                self._local_cache.set(key, value, ttl)
             
             return True
         
@@ -157,6 +270,110 @@ class RedisCache:
             log.warning("Cache set failed", key=key, exc_info=e)
             return False
     
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Get a value, loading and caching it on a miss — single-flight.
+
+        When N coroutines miss on the same key concurrently, only the
+        first runs the loader (e.g. a PostgreSQL query); the rest await
+        the same in-flight future instead of stampeding the database.
+
+        Args:
+            key: Cache key
+            loader: Zero-arg coroutine producing the value on a miss
+            ttl: Time-to-live in seconds (default: from settings)
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            value = await loader()
+            await self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # Awaiters see the exception; avoid "never retrieved" noise
+            # when nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def mget(self, keys: list[str]) -> list[Optional[Any]]:
+        """
+        Get multiple values in one round trip.
+
+        A loop over get() pays one network RTT per key; MGET fetches
+        them all in a single command.
+
+        Args:
+            keys: Cache keys, in order
+
+        Returns:
+            Values aligned with keys; None for misses
+        """
+        if not keys:
+            return []
+
+        try:
+            if self.redis_client:
+                raw = await self.redis_client.mget(keys)
+                return [_loads(v) if v else None for v in raw]
+            return [self._local_cache.get(key) for key in keys]
+        except Exception as e:
+            log.warning("Cache mget failed", key_count=len(keys), exc_info=e)
+
+        return [None] * len(keys)
+
+    async def mset(self, mapping: dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set multiple values in one pipelined round trip.
+
+        Args:
+            mapping: Key -> value (values must be JSON serializable)
+            ttl: Time-to-live in seconds (default: from settings)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not mapping:
+            return True
+
+        ttl = ttl or settings.CACHE_TTL
+
+        try:
+            if self.redis_client:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key, value in mapping.items():
+                        pipe.setex(key, ttl, _dumps(value))
+                    await pipe.execute()
+            else:
+                for key, value in mapping.items():
+                    self._local_cache.set(key, value, ttl)
+
+            return True
+
+        except Exception as e:
+            log.warning("Cache mset failed", key_count=len(mapping), exc_info=e)
+            return False
+
     async def delete(self, key: str) -> bool:
         """
         Delete value from cache.
@@ -171,7 +388,7 @@ class RedisCache:
             if self.redis_client:
                 await self.redis_client.delete(key)
             else:
-                self._local_cache.pop(key, None)
+                self._local_cache.pop(key)
             
             return True
         
@@ -179,6 +396,33 @@ class RedisCache:
             log.warning("Cache delete failed", key=key, exc_info=e)
             return False
     
+    async def delete_pattern(self, pattern: str) -> bool:
+        """
+        Delete all keys matching a glob-style pattern.
+
+        Uses SCAN (not KEYS) so large keyspaces don't block Redis.
+
+        Args:
+            pattern: Glob pattern, e.g. "conv:list:*"
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if self.redis_client:
+                async for key in self.redis_client.scan_iter(match=pattern):
+                    await self.redis_client.delete(key)
+            else:
+                prefix = pattern.rstrip("*")
+                for key in [k for k in self._local_cache.keys() if k.startswith(prefix)]:
+                    self._local_cache.pop(key)
+
+            return True
+
+        except Exception as e:
+            log.warning("Cache pattern delete failed", pattern=pattern, exc_info=e)
+            return False
+
     async def clear(self) -> bool:
         """
         Clear all cache entries.
@@ -208,10 +452,15 @@ class RedisCache:
         Background task to periodically reload cache from PostgreSQL.
         
         This ensures cache stays fresh with database changes made by other services.
+
+        The sleep is jittered ±20% so multiple app instances don't all
+        hit PostgreSQL at the same instant every interval.
         """
         while True:
             try:
-                await asyncio.sleep(settings.CACHE_HOT_RELOAD_INTERVAL)
+                await asyncio.sleep(
+                    settings.CACHE_HOT_RELOAD_INTERVAL * random.uniform(0.8, 1.2)
+                )
                 await self._reload_cache()
             except asyncio.CancelledError:
                 break
@@ -221,20 +470,84 @@ class RedisCache:
     async def _reload_cache(self) -> None:
         """
         Reload frequently accessed data from PostgreSQL to cache.
-        
-        TODO: In Step 1.4, this will reload:
-        - Recent conversation summaries
+
+        A cheap 1-row probe (count of conversations updated since the
+        last successful reload) short-circuits the cycle when nothing
+        changed, so most iterations cost one indexed count instead of a
+        full reload. A real reload is one SELECT (conversations with a
+        selectin batch of trimmed executions) plus one pipelined Redis
+        flush — not a query per conversation.
+
+        TODO: In Step 1.4, this will also reload:
         - Agent performance metrics
         - User preferences
         """
+        # Local imports: postgres/models import from config like this
+        # module does, but must not be needed unless hot reload runs
+        from sqlalchemy import func, select
+        from sqlalchemy.orm import load_only, selectinload
+
+        from app.db.models import AgentExecution, Conversation
+        from app.db.postgres import get_db_session
+
         log.debug("Hot reload triggered")
-        
-        # TODO: Implement actual reload logic in Step 1.4
-        # Example:
-        # async with get_db_session() as db:
-        #     conversations = await db.execute(select(Conversation).limit(100))
-        #     for conv in conversations.scalars():
-        #         await self.set(f"conv:{conv.id}", conv.dict())
+
+        reload_started_at = datetime.now(timezone.utc)
+
+        async with get_db_session() as db:
+            if self._last_reload_at is not None:
+                changed = await db.scalar(
+                    select(func.count())
+                    .select_from(Conversation)
+                    .where(Conversation.updated_at > self._last_reload_at)
+                )
+                if not changed:
+                    log.debug("Hot reload skipped, no changes since last run")
+                    self._last_reload_at = reload_started_at
+                    return
+
+            # Hot set: the 100 most recently active conversations, with
+            # only the execution columns the summaries need
+            stmt = (
+                select(Conversation)
+                .options(
+                    selectinload(Conversation.agent_executions).options(
+                        load_only(
+                            AgentExecution.id,
+                            AgentExecution.status,
+                            AgentExecution.started_at,
+                        )
+                    )
+                )
+                .order_by(Conversation.updated_at.desc())
+                .limit(100)
+            )
+            result = await db.execute(stmt)
+            conversations = result.scalars().all()
+
+            warm_entries = {
+                f"conv:{conv.id}": {
+                    "id": conv.id,
+                    "title": conv.title,
+                    "user_id": conv.user_id,
+                    "updated_at": conv.updated_at.isoformat(),
+                    "executions": [
+                        {
+                            "id": exec.id,
+                            "status": exec.status,
+                            "started_at": exec.started_at.isoformat(),
+                        }
+                        for exec in conv.agent_executions
+                    ],
+                }
+                for conv in conversations
+            }
+
+        # One pipelined flush instead of a SETEX round trip per entry
+        await self.mset(warm_entries)
+        log.debug("Hot reload completed", warmed=len(warm_entries))
+
+        self._last_reload_at = reload_started_at
 
 
 # =============================================================================
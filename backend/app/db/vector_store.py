@@ -18,22 +18,30 @@ Key Concepts:
 - Namespaces: Logical separation of vectors (e.g., by user)
 """
 
+import asyncio
+import hashlib
 from typing import Any, Optional
 
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
-from langchain_pinecone import PineconeVectorStore
-
 try:
-    from langchain_chroma import Chroma
-    CHROMA_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    CHROMA_AVAILABLE = False
+    NUMPY_AVAILABLE = False
+
+# NOTE: langchain_google_genai / langchain_pinecone / langchain_chroma
+# are imported lazily inside the functions that need them — they drag in
+# torch/transformers and add hundreds of ms to cold start, which would
+# otherwise be paid before the app can even serve /health
 
 from app.config import settings
 from app.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Texts per embedding request: providers process each request serially,
+# so chunking lets batches overlap while respecting batch-size limits
+EMBED_BATCH_SIZE = 64
+
 
 # =============================================================================
 # EMBEDDING MODEL INITIALIZATION
@@ -54,6 +62,8 @@ def get_embedding_model():
         Embedding model instance
     """
     if settings.DEFAULT_LLM_PROVIDER == "google":
+        from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
         return GoogleGenerativeAIEmbeddings(
             model="models/text-embedding-004",
             google_api_key=settings.GOOGLE_API_KEY,
@@ -62,14 +72,133 @@ def get_embedding_model():
         # Groq doesn't provide embeddings API, so we use sentence-transformers locally
         # This is faster and doesn't consume API quota
         from langchain_huggingface import HuggingFaceEmbeddings
-        
+
+        model_kwargs = {"device": _resolve_embedding_device()}
+        if settings.EMBEDDING_BACKEND == "onnx":
+            # ONNX Runtime fuses the MiniLM graph and uses int8/VNNI
+            # kernels — typically 2-4x faster than eager PyTorch on CPU
+            model_kwargs["backend"] = "onnx"
+
         return HuggingFaceEmbeddings(
             model_name="sentence-transformers/all-MiniLM-L6-v2",
-            model_kwargs={"device": "cpu"},  # Change to "cuda" for GPU
+            model_kwargs=model_kwargs,
             encode_kwargs={"normalize_embeddings": True},
         )
 
 
+def _resolve_embedding_device() -> str:
+    """
+    Pick the device for local sentence-transformers embeddings.
+
+    MiniLM throughput is an order of magnitude higher on CUDA/MPS than
+    CPU; honoring an explicit EMBEDDING_DEVICE but detecting
+    accelerators under the default "auto" means GPU machines stop
+    silently embedding on CPU.
+    """
+    if settings.EMBEDDING_DEVICE != "auto":
+        return settings.EMBEDDING_DEVICE
+
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            return "cuda"
+        if getattr(torch.backends, "mps", None) and torch.backends.mps.is_available():
+            return "mps"
+    except ImportError:
+        pass
+
+    return "cpu"
+
+
+# =============================================================================
+# QUERY EMBEDDING CACHE
+# =============================================================================
+
+# Queries recur often in agent replays; a day of reuse is safe because
+# an embedding for a given (model, text) pair never changes
+EMBEDDING_CACHE_TTL = 86400
+
+
+def quantize_embedding(vector: list[float]) -> list[float]:
+    """
+    Round an embedding to float16 precision.
+
+    Cosine similarity is robust to half precision, and the shorter
+    decimal representations roughly halve the bytes shipped to and
+    stored by the vector database. No-op without numpy.
+    """
+    if not NUMPY_AVAILABLE:
+        return vector
+    return np.asarray(vector, dtype=np.float16).astype(float).tolist()
+
+
+class QueryCachingEmbeddings:
+    """
+    Wraps an embeddings model with a Redis cache for query embeddings.
+
+    similarity_search re-embeds its query on every call even when the
+    exact text recurs. Keying by SHA-256 of the normalized text (plus
+    the model name, so switching providers can't serve stale vectors)
+    turns repeat queries into a cache lookup instead of a provider call.
+    Document embedding passes straight through.
+    """
+
+    def __init__(self, inner: Any, model_name: str):
+        self._inner = inner
+        self._model_name = model_name
+
+    def _cache_key(self, text: str) -> str:
+        digest = hashlib.sha256(text.strip().lower().encode()).hexdigest()
+        return f"emb:{self._model_name}:{digest}"
+
+    async def aembed_query(self, text: str) -> list[float]:
+        from app.db.redis_cache import cache
+
+        key = self._cache_key(text)
+
+        # Raw float16 bytes are ~6x smaller than a JSON float list, so
+        # prefer binary GET/SET against Redis when numpy is available
+        if NUMPY_AVAILABLE and cache.redis_client is not None:
+            try:
+                raw = await cache.redis_client.get(key)
+                if raw:
+                    return np.frombuffer(raw, dtype=np.float16).astype(float).tolist()
+                vector = await self._inner.aembed_query(text)
+                await cache.redis_client.setex(
+                    key,
+                    EMBEDDING_CACHE_TTL,
+                    np.asarray(vector, dtype=np.float16).tobytes(),
+                )
+                return vector
+            except Exception as e:
+                log.warning("Embedding cache access failed", exc_info=e)
+                return await self._inner.aembed_query(text)
+
+        hit = await cache.get(key)
+        if hit is not None:
+            return hit
+
+        vector = await self._inner.aembed_query(text)
+        await cache.set(key, vector, ttl=EMBEDDING_CACHE_TTL)
+        return vector
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._inner.embed_query(text)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [quantize_embedding(v) for v in self._inner.embed_documents(texts)]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        vectors = await self._inner.aembed_documents(texts)
+        return [quantize_embedding(v) for v in vectors]
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything else (model config, client handles) belongs to the
+        # wrapped embeddings object
+        return getattr(self._inner, name)
+
+
 # =============================================================================
 # VECTOR STORE MANAGER
 # =============================================================================
@@ -83,18 +212,25 @@ class VectorStoreManager:
     def __init__(self):
         self.vector_store: Optional[Any] = None
         self.embeddings = None
+        # Cap concurrent embedding requests so batching doesn't turn
+        # into a provider QPS spike
+        self._embed_semaphore = asyncio.Semaphore(settings.EMBED_CONCURRENCY)
     
     async def initialize(self) -> None:
         """
         Initialize vector store based on configuration.
         Creates index/collection if it doesn't exist.
         """
-        self.embeddings = get_embedding_model()
-        
+        inner = get_embedding_model()
+        model_name = getattr(inner, "model", None) or getattr(inner, "model_name", "unknown")
+        self.embeddings = QueryCachingEmbeddings(inner, model_name)
+
         if settings.VECTOR_DB_TYPE == "pinecone":
             await self._init_pinecone()
         elif settings.VECTOR_DB_TYPE == "chromadb":
             await self._init_chromadb()
+        elif settings.VECTOR_DB_TYPE == "pgvector":
+            await self._init_pgvector()
         else:
             raise ValueError(f"Unsupported vector DB: {settings.VECTOR_DB_TYPE}")
         
@@ -109,8 +245,9 @@ class VectorStoreManager:
         - Serverless: Auto-scaling
         - Low latency: Global deployment
         """
+        from langchain_pinecone import PineconeVectorStore
         from pinecone import Pinecone, ServerlessSpec
-        
+
         # Initialize Pinecone client
         pc = Pinecone(api_key=settings.PINECONE_API_KEY)
         
@@ -148,9 +285,11 @@ class VectorStoreManager:
         - Embedded mode for development
         - Persistent storage
         """
-        if not CHROMA_AVAILABLE:
+        try:
+            from langchain_chroma import Chroma
+        except ImportError:
             raise ImportError("ChromaDB not installed. Run: uv pip install chromadb")
-        
+
         # Use persistent storage in data directory
         persist_directory = "data/chromadb"
         
@@ -161,6 +300,53 @@ class VectorStoreManager:
         )
         log.info("ChromaDB initialized", persist_dir=persist_directory)
     
+    async def _init_pgvector(self) -> None:
+        """
+        Initialize pgvector store inside the existing PostgreSQL.
+
+        Colocating embeddings with the ORM removes the network hop to an
+        external vector service and lets similarity search JOIN against
+        the agent_executions filters/indexes in one SQL query. Best for
+        moderate vector volumes where HNSW in Postgres is plenty.
+        """
+        try:
+            from langchain_postgres import PGVector
+        except ImportError:
+            raise ImportError(
+                "pgvector support not installed. Run: uv pip install langchain-postgres"
+            )
+
+        from sqlalchemy import text as sql_text
+
+        from app.db.postgres import engine
+
+        async with engine.begin() as conn:
+            await conn.execute(sql_text("CREATE EXTENSION IF NOT EXISTS vector"))
+
+        self.vector_store = PGVector(
+            embeddings=self.embeddings,
+            collection_name=settings.CHROMA_COLLECTION_NAME or "agent_embeddings",
+            connection=settings.DATABASE_URL,
+            use_jsonb=True,
+            async_mode=True,
+        )
+
+        # HNSW beats the default sequential scan by orders of magnitude;
+        # the embedding table only exists after PGVector's first setup,
+        # hence the guard
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    sql_text(
+                        "CREATE INDEX IF NOT EXISTS ix_langchain_pg_embedding_hnsw "
+                        "ON langchain_pg_embedding USING hnsw (embedding vector_cosine_ops)"
+                    )
+                )
+        except Exception as e:
+            log.warning("Could not create HNSW index (will retry next startup)", exc_info=e)
+
+        log.info("pgvector store initialized")
+
     async def add_texts(
         self,
         texts: list[str],
@@ -180,11 +366,26 @@ class VectorStoreManager:
         """
         if not self.vector_store:
             raise RuntimeError("Vector store not initialized")
-        
-        ids = await self.vector_store.aadd_texts(
-            texts=texts,
-            metadatas=metadatas,
-        )
+
+        # Chunk the input so embedding calls overlap instead of one
+        # giant serial request; the semaphore caps provider concurrency
+        async def _add_batch(batch_texts: list[str], batch_metadatas: Optional[list[dict]]) -> list[str]:
+            async with self._embed_semaphore:
+                return await self.vector_store.aadd_texts(
+                    texts=batch_texts,
+                    metadatas=batch_metadatas,
+                )
+
+        batches = [
+            _add_batch(
+                texts[i:i + EMBED_BATCH_SIZE],
+                metadatas[i:i + EMBED_BATCH_SIZE] if metadatas else None,
+            )
+            for i in range(0, len(texts), EMBED_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*batches)
+        ids = [doc_id for batch_ids in results for doc_id in batch_ids]
+
         log.info("Texts added to vector store", count=len(texts), namespace=namespace)
         return ids
     
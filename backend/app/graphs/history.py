@@ -0,0 +1,108 @@
+# agenticAI/backend/app/graphs/history.py
+
+"""
+Conversation-history trimming for LLM calls.
+
+LLM prefill cost scales with total prompt tokens (attention is O(N²)),
+so sending the full thread to the router every turn makes per-turn
+latency grow without bound. trim_history keeps the newest messages that
+fit a token budget and collapses everything older into one compact
+system note, bounding per-turn cost regardless of thread length.
+"""
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+from langchain_core.messages import SystemMessage
+
+from app.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Fallback when tiktoken isn't installed: ~4 chars per token holds for
+# typical English text and errs on the conservative side
+_CHARS_PER_TOKEN = 4
+
+# Per-turn excerpt length in the summary note
+_SUMMARY_EXCERPT_CHARS = 60
+
+_encoding = None
+
+
+def _get_encoding():
+    """Lazily load the tokenizer — get_encoding is slow at import time."""
+    global _encoding
+    if _encoding is None and TIKTOKEN_AVAILABLE:
+        _encoding = tiktoken.get_encoding("cl100k_base")
+    return _encoding
+
+
+def estimate_tokens(text: str) -> int:
+    """Token count of text, exact with tiktoken or estimated without."""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def trim_history(messages: list, max_tokens: int) -> list:
+    """
+    Keep the newest messages within a token budget.
+
+    Walks from the newest message backward accumulating token counts;
+    anything that doesn't fit is collapsed into a single leading
+    SystemMessage noting what was dropped (turn count plus a short
+    excerpt per dropped turn), so the router keeps coarse awareness of
+    the early conversation without paying its tokens.
+
+    Args:
+        messages: Full message history, oldest first
+        max_tokens: Token budget for the retained window
+
+    Returns:
+        Trimmed history, oldest first (unchanged list if it already fits)
+    """
+    if not messages:
+        return messages
+
+    kept = []
+    used = 0
+    for message in reversed(messages):
+        content = message.content
+        if not isinstance(content, str):
+            content = str(content)
+        cost = estimate_tokens(content)
+        if kept and used + cost > max_tokens:
+            break
+        kept.append(message)
+        used += cost
+
+    kept.reverse()
+    dropped = messages[: len(messages) - len(kept)]
+    if not dropped:
+        return messages
+
+    excerpts = []
+    for turn, message in enumerate(dropped):
+        content = message.content
+        if not isinstance(content, str):
+            content = str(content)
+        excerpts.append(f"turn {turn} ({message.type}): {content[:_SUMMARY_EXCERPT_CHARS]}")
+
+    summary = SystemMessage(
+        content=(
+            f"Summary of {len(dropped)} earlier turn(s) omitted for length:\n"
+            + "\n".join(excerpts)
+        )
+    )
+
+    log.info(
+        "History trimmed",
+        dropped=len(dropped),
+        kept=len(kept),
+        tokens=used,
+    )
+    return [summary] + kept
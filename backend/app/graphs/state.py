@@ -52,6 +52,9 @@ class AgentState(TypedDict):
     # Routing information (replaces on each update)
     next_agent: Optional[str]
     current_agent: Optional[str]
+
+    # Independent (agent, task) subtasks for the parallel_agents node
+    task_queue: list
     
     # Conversation tracking
     conversation_id: Optional[str]
@@ -101,6 +104,7 @@ def create_initial_state(
         messages=[HumanMessage(content=user_message)],
         next_agent="supervisor",  # Always start with supervisor
         current_agent=None,
+        task_queue=[],
         conversation_id=conversation_id,
         user_id=user_id,
         metadata={
@@ -10,63 +10,273 @@ KEY IMPROVEMENTS:
 4. Better error handling with user-friendly messages
 """
 
+import asyncio
+import hashlib
+import re
+import time
 import uuid
+
+import orjson
+from collections import OrderedDict
 from typing import Literal, Optional
 
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.graph import END, START, StateGraph
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 
-from app.agents.analysis_agent import AnalysisAgent
-from app.agents.data_ingestion_agent import DataIngestionAgent
-from app.agents.notification_agent import NotificationAgent
-from app.agents.query_agent import QueryAgent
-from app.agents.report_agent import ReportAgent
-from app.agents.supervisor import SupervisorAgent
+from app.agents import get_agent, get_agent_pool
+from app.agents.base_agent import BaseAgent
+from app.agents.supervisor import RoutingDecision
 from app.config import settings
+from app.graphs.history import trim_history
 from app.graphs.state import AgentState
 from app.utils.logger import get_logger
 
 log = get_logger(__name__)
 
-# Initialize agents
-supervisor = SupervisorAgent()
-data_ingestion_agent = DataIngestionAgent()
-analysis_agent = AnalysisAgent()
-query_agent = QueryAgent()
-report_agent = ReportAgent()
-notification_agent = NotificationAgent()
+# The supervisor only routes, so a single shared instance is fine;
+# workers execute tasks concurrently and come from bounded pools so
+# parallel requests don't serialize on one instance's internal state
+supervisor = get_agent("supervisor")
+
+WORKER_POOLS = {
+    "data_ingestion_agent": get_agent_pool("data_ingestion_agent"),
+    "analysis_agent": get_agent_pool("analysis_agent"),
+    "query_agent": get_agent_pool("query_agent"),
+    "report_agent": get_agent_pool("report_agent"),
+    "notification_agent": get_agent_pool("notification_agent"),
+}
+
+# Cap concurrent speculative worker calls so mispredictions can't
+# saturate provider rate limits
+_speculative_semaphore = asyncio.Semaphore(4)
+
+
+async def _run_worker(agent_name: str, task: str, context: Optional[dict] = None) -> dict:
+    """Execute a task on a pooled instance of the named worker."""
+    async with WORKER_POOLS[agent_name].acquire() as agent:
+        return await agent.execute(task, context=context)
+
+
+def _result_message(agent_name: str, result: dict) -> AIMessage:
+    """
+    Build the output message for a worker result.
+
+    One construction site instead of a copy per node. The AIMessage
+    itself is deliberately NOT pooled: it escapes into checkpoints and
+    caller-held state, and add_messages relies on distinct identities.
+    """
+    return AIMessage(
+        content=result["output"] if result["success"] else f"Error: {result.get('error')}",
+        name=agent_name,
+    )
+
+
+async def _speculative_execute(agent_name: str, task: str) -> dict:
+    """Run a worker speculatively, bounded by the speculation semaphore."""
+    async with _speculative_semaphore:
+        return await _run_worker(agent_name, task)
+
+
+# =============================================================================
+# PRE-LLM ROUTING HINTS
+# =============================================================================
+# Trivial greetings and unambiguous tool verbs don't need a routing LLM
+# call at all. Patterns are compiled once at import; decisions are frozen
+# dataclasses so the shared constants are safe to return repeatedly.
+
+ROUTING_HINTS: tuple[tuple[re.Pattern, RoutingDecision], ...] = (
+    (
+        re.compile(r"^\s*(hi|hello|hey|good (morning|afternoon|evening))[\s!.,]*$", re.IGNORECASE),
+        RoutingDecision(
+            can_answer_directly=True,
+            direct_answer="Hello! How can I help you today?",
+            delegate_to="FINISH",
+            reasoning="Greeting fast-path, no LLM call",
+        ),
+    ),
+    (
+        re.compile(r"^\s*(thanks|thank you|thx)[\s!.,]*$", re.IGNORECASE),
+        RoutingDecision(
+            can_answer_directly=True,
+            direct_answer="You're welcome! Let me know if you need anything else.",
+            delegate_to="FINISH",
+            reasoning="Gratitude fast-path, no LLM call",
+        ),
+    ),
+    (
+        re.compile(r"^\s*(ingest|upload|load)\b", re.IGNORECASE),
+        RoutingDecision(
+            can_answer_directly=False,
+            delegate_to="data_ingestion_agent",
+            reasoning="Ingestion verb fast-path, no LLM call",
+        ),
+    ),
+    (
+        re.compile(r"^\s*(query|search|find|look up)\b", re.IGNORECASE),
+        RoutingDecision(
+            can_answer_directly=False,
+            delegate_to="query_agent",
+            reasoning="Query verb fast-path, no LLM call",
+        ),
+    ),
+)
+
+
+def _match_routing_hint(user_message: str) -> Optional[RoutingDecision]:
+    """Return a canned routing decision for trivially classifiable messages."""
+    for pattern, decision in ROUTING_HINTS:
+        if pattern.search(user_message):
+            return decision
+    return None
+
+
+# =============================================================================
+# ROUTING DECISION CACHE
+# =============================================================================
+# The routing LLM call dominates request latency; repeat and
+# near-duplicate queries are common, and a routing decision for the
+# same message + history is stable enough to reuse for a few minutes.
+
+ROUTING_CACHE_TTL = 300
+ROUTING_CACHE_MAX = 256
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_routing_cache: OrderedDict[str, tuple[RoutingDecision, float]] = OrderedDict()
+_routing_cache_lock = asyncio.Lock()
+
+
+def _routing_cache_key(last_message: str, history: list) -> str:
+    """
+    Hash the normalized message plus a digest of prior message content.
+
+    Message IDs and timestamps are deliberately excluded so identical
+    semantic content collides regardless of when it was sent.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_WHITESPACE_RE.sub(" ", last_message.strip().lower()).encode())
+    for message in history:
+        h.update(b"\x00")
+        h.update(str(getattr(message, "content", "")).encode())
+    return h.hexdigest()
+
+
+async def _routing_cache_get(key: str) -> Optional[RoutingDecision]:
+    async with _routing_cache_lock:
+        entry = _routing_cache.get(key)
+        if entry is None:
+            return None
+        decision, expires_at = entry
+        if time.monotonic() >= expires_at:
+            _routing_cache.pop(key, None)
+            return None
+        _routing_cache.move_to_end(key)
+        return decision
+
+
+async def _routing_cache_put(key: str, decision: RoutingDecision) -> None:
+    async with _routing_cache_lock:
+        _routing_cache[key] = (decision, time.monotonic() + ROUTING_CACHE_TTL)
+        _routing_cache.move_to_end(key)
+        while len(_routing_cache) > ROUTING_CACHE_MAX:
+            _routing_cache.popitem(last=False)
 
 
 # =============================================================================
 # SUPERVISOR NODE WITH INTELLIGENT ROUTING
 # =============================================================================
-async def supervisor_node(state: AgentState) -> AgentState:
+async def supervisor_node(state: AgentState) -> dict:
     """
     Supervisor decides: answer directly or delegate?
+
+    Returns only the state keys it changed; the `add_messages` reducer
+    on AgentState merges message deltas, so the checkpointer serializes
+    the delta rather than the whole accumulated state on every hop.
     """
     log.info("Supervisor analyzing request")
-    
+
     messages = state["messages"]
     last_message = messages[-1].content if messages else ""
-    
+
     # Check if we've already executed agents
     execution_count = state.get("execution_count", 0)
-    
+
     # If this is a return from a worker agent, finish
     current_agent = state.get("current_agent")
     if current_agent and current_agent != "supervisor":
         log.info("Received response from worker, finishing")
-        state["next_agent"] = END
-        return state
+        return {"next_agent": END}
     
     # Make routing decision
     try:
-        decision = await supervisor.make_routing_decision(
-            user_message=last_message,
-            conversation_history=messages[:-1] if len(messages) > 1 else None
-        )
-        
+        speculative_task: Optional[asyncio.Task] = None
+        speculative_agent: Optional[str] = None
+
+        # Hint table first (pure regex, no locks), then the decision
+        # cache; the LLM only runs when both miss.
+        decision = _match_routing_hint(last_message)
+        if decision is not None:
+            log.info("Routing decision from fast-path hint")
+        if decision is None:
+            # Bounded window instead of the full thread: keeps routing
+            # prompt size (and the cache key basis) constant as the
+            # conversation grows
+            history = trim_history(messages[:-1], settings.MAX_HISTORY_TOKENS)
+            cache_key = _routing_cache_key(last_message, history)
+            decision = await _routing_cache_get(cache_key)
+            if decision is not None:
+                log.info("Routing decision served from cache")
+        if decision is None:
+            # Speculative dispatch: when keywords make the route obvious,
+            # fire the worker in parallel with the LLM routing call.
+            # If the router agrees we've overlapped both round-trips;
+            # if it disagrees we cancel the speculative call.
+            speculative_agent = supervisor.fast_classify(last_message)
+            if speculative_agent:
+                speculative_task = asyncio.create_task(
+                    _speculative_execute(speculative_agent, last_message)
+                )
+                log.info("Speculative worker dispatched", agent=speculative_agent)
+
+            decision = await supervisor.make_routing_decision(
+                user_message=last_message,
+                conversation_history=history if len(messages) > 1 else None
+            )
+            # Never cache the degraded error fallback: one transient LLM
+            # failure would otherwise serve its canned (or stale) answer
+            # to every matching query for the full TTL
+            if not decision.is_fallback:
+                await _routing_cache_put(cache_key, decision)
+
+        if speculative_task:
+            if (
+                not decision.can_answer_directly
+                and decision.delegate_to == speculative_agent
+            ):
+                # Router agreed — consume the already-running worker call
+                result = await speculative_task
+                output_message = _result_message(speculative_agent, result)
+
+                log.info("Speculative dispatch confirmed", agent=speculative_agent)
+                return {
+                    "messages": [output_message],
+                    "current_agent": speculative_agent,
+                    "next_agent": END,
+                    "execution_count": execution_count + 1,
+                }
+
+            # Router disagreed — abandon the speculative call
+            speculative_task.cancel()
+            log.info(
+                "Speculative dispatch cancelled",
+                speculated=speculative_agent,
+                actual=decision.delegate_to,
+            )
+
         log.info(
             "Routing decision made",
             can_answer_directly=decision.can_answer_directly,
@@ -75,122 +285,171 @@ async def supervisor_node(state: AgentState) -> AgentState:
         
         # If can answer directly
         if decision.can_answer_directly and decision.direct_answer:
-            # Add supervisor's answer to messages
             answer_message = AIMessage(
                 content=decision.direct_answer,
                 name="supervisor"
             )
-            state["messages"].append(answer_message)
-            state["next_agent"] = END
-            state["current_agent"] = "supervisor"
-            
+
             log.info("Supervisor answered directly")
-            return state
-        
+            return {
+                "messages": [answer_message],
+                "next_agent": END,
+                "current_agent": "supervisor",
+            }
+
+        # Multi-part request: fan the subtasks out to the parallel node
+        if len(decision.parallel_tasks) > 1:
+            log.info(
+                "Delegating parallel subtasks",
+                task_count=len(decision.parallel_tasks),
+            )
+            return {
+                "task_queue": [list(spec) for spec in decision.parallel_tasks],
+                "next_agent": "parallel_agents",
+                "current_agent": "supervisor",
+                "execution_count": execution_count + 1,
+            }
+
         # Otherwise delegate
-        state["next_agent"] = decision.delegate_to
-        state["current_agent"] = "supervisor"
-        state["execution_count"] = execution_count + 1
-        
-        return state
-        
+        return {
+            "next_agent": decision.delegate_to,
+            "current_agent": "supervisor",
+            "execution_count": execution_count + 1,
+        }
+
     except Exception as e:
         log.error(f"Supervisor decision failed: {e}", exc_info=True)
-        
+
         # Fallback: delegate to analysis agent
-        state["next_agent"] = "analysis_agent"
-        state["execution_count"] = execution_count + 1
-        return state
+        return {
+            "next_agent": "analysis_agent",
+            "execution_count": execution_count + 1,
+        }
 
 
 # =============================================================================
 # WORKER AGENT NODES (Simplified)
 # =============================================================================
-async def analysis_node(state: AgentState) -> AgentState:
+async def analysis_node(state: AgentState) -> dict:
     """Analysis agent execution."""
     log.info("Analysis agent executing")
-    
+
     messages = state["messages"]
     task = messages[-1].content if messages else ""
-    
-    result = await analysis_agent.execute(task)
-    
-    output_message = AIMessage(
-        content=result["output"] if result["success"] else f"Error: {result.get('error')}",
-        name="analysis_agent"
-    )
-    
-    state["messages"].append(output_message)
-    state["current_agent"] = "analysis_agent"
-    state["next_agent"] = END  # Always end after worker completes
-    
-    return state
 
+    result = await _run_worker("analysis_agent", task)
+
+    # Delta only — add_messages appends, scalars replace
+    return {
+        "messages": [_result_message("analysis_agent", result)],
+        "current_agent": "analysis_agent",
+        "next_agent": END,  # Always end after worker completes
+    }
 
-async def data_ingestion_node(state: AgentState) -> AgentState:
+
+async def data_ingestion_node(state: AgentState) -> dict:
     """Data ingestion agent execution."""
     log.info("Data ingestion agent executing")
-    
+
     messages = state["messages"]
     task = messages[-1].content if messages else ""
-    
-    result = await data_ingestion_agent.execute(task)
-    
-    output_message = AIMessage(
-        content=result["output"] if result["success"] else f"Error: {result.get('error')}",
-        name="data_ingestion_agent"
-    )
-    
-    state["messages"].append(output_message)
-    state["current_agent"] = "data_ingestion_agent"
-    state["next_agent"] = END
-    
-    return state
 
+    result = await _run_worker("data_ingestion_agent", task)
+
+    return {
+        "messages": [_result_message("data_ingestion_agent", result)],
+        "current_agent": "data_ingestion_agent",
+        "next_agent": END,
+    }
 
-async def query_node(state: AgentState) -> AgentState:
+
+async def query_node(state: AgentState) -> dict:
     """Query agent execution."""
     log.info("Query agent executing")
-    
+
     messages = state["messages"]
     task = messages[-1].content if messages else ""
-    
-    result = await query_agent.execute(task)
-    
-    output_message = AIMessage(
-        content=result["output"] if result["success"] else f"Error: {result.get('error')}",
-        name="query_agent"
+
+    result = await _run_worker("query_agent", task)
+
+    return {
+        "messages": [_result_message("query_agent", result)],
+        "current_agent": "query_agent",
+        "next_agent": END,
+    }
+
+
+async def parallel_agents_node(state: AgentState) -> dict:
+    """
+    Run independent subtasks from task_queue concurrently.
+
+    Latency is max(subtask_i) instead of sum — each subtask would
+    otherwise cost its own supervisor round-trip and graph iteration.
+    """
+    queue = state.get("task_queue") or []
+    log.info("Parallel agents executing", task_count=len(queue))
+
+    # Every subtask gets the original request as context so workers see
+    # the overall goal, not just their slice. Pre-formatted once here:
+    # each receiving agent's _format_context short-circuits instead of
+    # re-serializing the same dict N times.
+    messages = state.get("messages") or []
+    shared_context = None
+    if messages:
+        shared_context = BaseAgent.preformat_context(
+            {"original_request": messages[-1].content}
+        )
+
+    results = await asyncio.gather(
+        *(_run_worker(agent_name, task, shared_context) for agent_name, task in queue),
+        return_exceptions=True,
     )
-    
-    state["messages"].append(output_message)
-    state["current_agent"] = "query_agent"
-    state["next_agent"] = END
-    
-    return state
+
+    output_messages = []
+    for (agent_name, _), result in zip(queue, results):
+        if isinstance(result, BaseException):
+            output_messages.append(AIMessage(content=f"Error: {result}", name=agent_name))
+        else:
+            output_messages.append(_result_message(agent_name, result))
+
+    return {
+        "messages": output_messages,
+        "current_agent": "parallel_agents",
+        "next_agent": END,
+        "task_queue": [],
+    }
 
 
 # =============================================================================
 # ROUTING FUNCTION
 # =============================================================================
+# Hoisted to module scope: router() runs on every graph transition, and
+# frozenset membership is O(1) with no per-call allocation
+_VALID_AGENTS = frozenset({"data_ingestion_agent", "analysis_agent", "query_agent"})
+_TERMINAL = frozenset({END, "FINISH"})
+
+
 def router(
     state: AgentState,
-) -> Literal["data_ingestion_agent", "analysis_agent", "query_agent", END]:
+) -> Literal["data_ingestion_agent", "analysis_agent", "query_agent", "parallel_agents", END]:
     """Route based on supervisor decision."""
-    
+
     next_agent = state.get("next_agent", END)
     execution_count = state.get("execution_count", 0)
-    
+
     # Safety: max 3 iterations total
     if execution_count >= 3:
         log.warning("Max iterations reached")
         return END
-    
-    # Check valid agent names
-    valid_agents = ["data_ingestion_agent", "analysis_agent", "query_agent"]
-    
-    if next_agent == END or next_agent == "FINISH" or next_agent not in valid_agents:
+
+    # Fan out when the supervisor queued multiple independent subtasks
+    if next_agent == "parallel_agents" and len(state.get("task_queue") or []) > 1:
+        log.info("Routing to parallel_agents")
+        return "parallel_agents"
+
+    if next_agent in _TERMINAL or next_agent not in _VALID_AGENTS:
         return END
-    
+
     log.info(f"Routing to {next_agent}")
     return next_agent
 
@@ -208,6 +467,7 @@ def create_supervisor_workflow() -> StateGraph:
     workflow.add_node("analysis_agent", analysis_node)
     workflow.add_node("data_ingestion_agent", data_ingestion_node)
     workflow.add_node("query_agent", query_node)
+    workflow.add_node("parallel_agents", parallel_agents_node)
     
     # Start with supervisor
     workflow.add_edge(START, "supervisor")
@@ -220,14 +480,16 @@ def create_supervisor_workflow() -> StateGraph:
             "analysis_agent": "analysis_agent",
             "data_ingestion_agent": "data_ingestion_agent",
             "query_agent": "query_agent",
+            "parallel_agents": "parallel_agents",
             END: END,
         },
     )
-    
+
     # All agents end immediately (no loops)
     workflow.add_edge("analysis_agent", END)
     workflow.add_edge("data_ingestion_agent", END)
     workflow.add_edge("query_agent", END)
+    workflow.add_edge("parallel_agents", END)
     
     log.info("Optimized workflow graph created")
     
@@ -237,10 +499,71 @@ def create_supervisor_workflow() -> StateGraph:
 # =============================================================================
 # CHECKPOINTER SETUP
 # =============================================================================
-_checkpointer_cm = None
+_checkpointer_pool: Optional[AsyncConnectionPool] = None
 _checkpointer_instance = None
 
 
+def _strip_message(message: BaseMessage) -> BaseMessage:
+    """
+    Return a copy without provider bookkeeping fields.
+
+    response_metadata/additional_kwargs (and usage_metadata on AI
+    messages) carry provider echo data that's useless after the turn but
+    gets serialized to Postgres on every checkpoint write. Message ids
+    are kept — add_messages needs them to dedup on merge.
+    """
+    has_usage = getattr(message, "usage_metadata", None)
+    if not (message.response_metadata or message.additional_kwargs or has_usage):
+        return message
+
+    stripped = message.model_copy()
+    stripped.response_metadata = {}
+    stripped.additional_kwargs = {}
+    if has_usage:
+        stripped.usage_metadata = None
+    return stripped
+
+
+# orjson serializes datetime/date/time and dataclasses natively, never
+# consulting `default` for them — which would bypass the base
+# serializer's constructor-revival encoding and reload those values as
+# plain strings/dicts. The passthrough flags route them back through
+# _default. (orjson has no passthrough for UUID, which it encodes as the
+# canonical string; nothing checkpointed here stores UUID objects.)
+_ORJSON_CHECKPOINT_OPTS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+class CheckpointSerializer(JsonPlusSerializer):
+    """
+    JsonPlusSerializer that drops message bookkeeping before writes and
+    encodes its JSON with orjson.
+
+    Checkpoint state (many messages per hop) is serialized on every
+    graph transition; orjson's C encoder cuts that CPU several-fold.
+    loads stays on the base implementation because the revival hook for
+    LangChain objects needs stdlib json's object_hook.
+    """
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(
+            obj, default=self._default, option=_ORJSON_CHECKPOINT_OPTS
+        )
+
+    def dumps_typed(self, obj):
+        if isinstance(obj, BaseMessage):
+            obj = _strip_message(obj)
+        elif isinstance(obj, list) and obj and isinstance(obj[0], BaseMessage):
+            obj = [
+                _strip_message(m) if isinstance(m, BaseMessage) else m
+                for m in obj
+            ]
+        return super().dumps_typed(obj)
+
+
 def convert_database_url_for_psycopg(url: str) -> str:
     """Convert SQLAlchemy URL to psycopg format."""
     url = url.replace('+asyncpg', '')
@@ -249,67 +572,259 @@ def convert_database_url_for_psycopg(url: str) -> str:
 
 
 async def get_checkpointer() -> AsyncPostgresSaver:
-    """Get or create checkpointer."""
-    global _checkpointer_cm, _checkpointer_instance
-    
+    """
+    Get or create the checkpointer, backed by a shared connection pool.
+
+    from_conn_string held a single connection, so every node's
+    checkpoint write serialized on it and a dropped connection killed
+    checkpointing entirely. An AsyncConnectionPool lets concurrent graph
+    runs checkpoint in parallel; prepare_threshold=0 makes psycopg
+    prepare the saver's repeated statements on first use so each write
+    is a single execute round-trip, and autocommit avoids an extra
+    BEGIN/COMMIT exchange per checkpoint.
+    """
+    global _checkpointer_pool, _checkpointer_instance
+
     if _checkpointer_instance is not None:
-        try:
-            conn = _checkpointer_instance.conn
-            if conn and not conn.closed:
-                return _checkpointer_instance
-        except:
-            pass
-    
+        if _checkpointer_pool is not None and not _checkpointer_pool.closed:
+            return _checkpointer_instance
+
     psycopg_url = convert_database_url_for_psycopg(settings.DATABASE_URL)
-    _checkpointer_cm = AsyncPostgresSaver.from_conn_string(psycopg_url)
-    _checkpointer_instance = await _checkpointer_cm.__aenter__()
+    _checkpointer_pool = AsyncConnectionPool(
+        psycopg_url,
+        min_size=2,
+        max_size=settings.POSTGRES_POOL_SIZE,
+        open=False,
+        kwargs={
+            "autocommit": True,
+            "prepare_threshold": 0,
+            # AsyncPostgresSaver reads rows by column name
+            "row_factory": dict_row,
+        },
+    )
+    await _checkpointer_pool.open()
+    _checkpointer_instance = AsyncPostgresSaver(
+        _checkpointer_pool, serde=CheckpointSerializer()
+    )
     await _checkpointer_instance.setup()
-    
-    log.info("Checkpointer initialized")
-    
+
+    log.info(
+        "Checkpointer initialized",
+        pool_min=2,
+        pool_max=settings.POSTGRES_POOL_SIZE,
+    )
+
     return _checkpointer_instance
 
 
+# Compiled once per process: rebuilding the StateGraph (nodes, edges,
+# conditional router) and re-compiling on every request is pure Python
+# overhead on the hot path
+_compiled_graph = None
+_graph_lock = asyncio.Lock()
+
+
 async def get_supervisor_graph():
-    """Get compiled graph with checkpointing."""
-    workflow = create_supervisor_workflow()
-    checkpointer = await get_checkpointer()
-    graph = workflow.compile(checkpointer=checkpointer)
-    return graph
+    """Get compiled graph with checkpointing (built once, then reused)."""
+    global _compiled_graph
+
+    if _compiled_graph is not None:
+        return _compiled_graph
+
+    async with _graph_lock:
+        # Double-checked: another request may have built it while we
+        # waited for the lock
+        if _compiled_graph is None:
+            workflow = create_supervisor_workflow()
+            checkpointer = await get_checkpointer()
+            _compiled_graph = workflow.compile(checkpointer=checkpointer)
+            log.info("Supervisor graph compiled")
+
+    return _compiled_graph
+
+
+# =============================================================================
+# REQUEST COALESCING
+# =============================================================================
+# Identical questions arriving while the first is still running (double
+# submits, bursty demo traffic) would each run the full graph — LLM
+# calls, checkpoints and all. Duplicates await the first request's
+# future instead.
+
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def _inflight_key(
+    user_message: str,
+    conversation_id: Optional[str],
+    user_id: Optional[str],
+) -> str:
+    """Coalescing key: normalized message scoped to user + conversation."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_WHITESPACE_RE.sub(" ", user_message.strip().lower()).encode())
+    h.update(b"\x00")
+    h.update((user_id or "").encode())
+    h.update(b"\x00")
+    h.update((conversation_id or "").encode())
+    return h.hexdigest()
 
 
 # =============================================================================
 # MAIN EXECUTION FUNCTION WITH ROBUST ERROR HANDLING
 # =============================================================================
+# User-facing error templates, classified in one pass over the error
+# string instead of re-scanning (and re-lowercasing) it per condition.
+# Order defines priority: first matching pattern wins.
+_ERROR_MAP: tuple[tuple[re.Pattern, str], ...] = (
+    (
+        re.compile(r"429|rate.?limit|too many requests", re.IGNORECASE),
+        "⚠️ **API Rate Limit Reached**\n\nPlease wait a moment and try again. Our system is temporarily at capacity.",
+    ),
+    (
+        re.compile(r"timeout", re.IGNORECASE),
+        "⏱️ **Request Timed Out**\n\nThe request took too long. Please try a simpler question or try again.",
+    ),
+    (
+        re.compile(r"connection", re.IGNORECASE),
+        "🔌 **Connection Error**\n\nCouldn't connect to required services. Please check your connection and try again.",
+    ),
+)
+
+
+def _serialize_messages(messages: list) -> list[dict]:
+    """
+    Convert messages to the role/content dicts the API layer returns.
+
+    BaseMessage always defines .type, so this skips the per-message
+    getattr the old inline comprehensions paid; callers build the list
+    once per reply and share it between response branches.
+    """
+    return [{"role": m.type, "content": m.content} for m in messages]
+
+
+def _classify_error(error_msg: str) -> str:
+    """Map a raw error string to its user-facing message."""
+    for pattern, template in _ERROR_MAP:
+        if pattern.search(error_msg):
+            return template
+    return f"❌ **Error Occurred**\n\n{error_msg[:150]}"
 async def execute_agent_workflow(
     user_message: str,
     conversation_id: Optional[str] = None,
     user_id: Optional[str] = None,
+) -> dict:
+    """
+    Execute workflow with request coalescing.
+
+    Concurrent duplicates (same normalized message, user, and
+    conversation) share the first caller's result instead of running
+    the graph again.
+    """
+    key = _inflight_key(user_message, conversation_id, user_id)
+
+    existing = _inflight.get(key)
+    if existing is not None:
+        log.info("Coalescing duplicate in-flight request")
+        # shield: a cancelled duplicate must not cancel the original
+        return await asyncio.shield(existing)
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await _execute_workflow(user_message, conversation_id, user_id)
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+        if not future.done():
+            # _execute_workflow raised; wake duplicates with the error
+            future.set_exception(RuntimeError("Coalesced request failed"))
+            future.exception()  # mark retrieved for the no-waiter case
+
+
+async def _execute_workflow(
+    user_message: str,
+    conversation_id: Optional[str] = None,
+    user_id: Optional[str] = None,
 ) -> dict:
     """
     Execute workflow with intelligent routing and error handling.
+
+    The graph is consumed via astream(stream_mode="updates") so each
+    node's delta is pushed to WebSocket subscribers the moment the node
+    finishes, instead of after the whole graph completes. The return
+    shape is unchanged for existing callers.
     """
+    from app.api.websockets.agent_updates import broadcast_agent_update
+    from app.agents.supervisor import try_local_answer
     from app.graphs.state import create_initial_state
     import traceback
-    
+
     if not conversation_id:
         conversation_id = str(uuid.uuid4())
-    
+
+    # Zero-LLM direct answers (greetings, trivial arithmetic) don't need
+    # the graph at all: running it would cost two checkpointer writes and
+    # a full state serialization just to echo a canned reply. These turns
+    # carry no state worth checkpointing, so they skip persistence too.
+    hint = _match_routing_hint(user_message)
+    direct_answer = (
+        hint.direct_answer if hint is not None and hint.can_answer_directly else None
+    )
+    if direct_answer is None:
+        direct_answer = try_local_answer(user_message)
+
+    if direct_answer is not None:
+        log.info("Direct answer served without graph", conversation_id=conversation_id)
+        return {
+            "success": True,
+            "conversation_id": conversation_id,
+            "response": direct_answer,
+            "messages": [
+                {"role": "human", "content": user_message},
+                {"role": "ai", "content": direct_answer},
+            ],
+            "metadata": {"fast_path": "direct_answer"},
+        }
+
     initial_state = create_initial_state(
         user_message=user_message,
         conversation_id=conversation_id,
         user_id=user_id,
     )
-    
+
     try:
         graph = await get_supervisor_graph()
         config = {"configurable": {"thread_id": conversation_id}}
-        
+
         log.info("Executing workflow", conversation_id=conversation_id)
-        
-        final_state = await graph.ainvoke(initial_state, config)
-        
-        messages = final_state.get("messages", [])
+
+        # Accumulate node deltas as they stream; nodes return partial
+        # state, so each chunk is {node_name: {changed keys}}
+        messages = list(initial_state["messages"])
+        metadata = initial_state.get("metadata", {})
+
+        async for chunk in graph.astream(initial_state, config, stream_mode="updates"):
+            for node_name, delta in chunk.items():
+                if not isinstance(delta, dict):
+                    continue
+
+                new_messages = delta.get("messages") or []
+                messages.extend(new_messages)
+                if "metadata" in delta:
+                    metadata = delta["metadata"]
+
+                # Push progress to subscribed WebSocket clients while the
+                # rest of the graph is still running
+                await broadcast_agent_update(
+                    update_type="node_completed",
+                    agent_name=node_name,
+                    data={
+                        "output": new_messages[-1].content if new_messages else None,
+                        "message_count": len(messages),
+                    },
+                    conversation_id=conversation_id,
+                )
         
         # Validate response
         if not messages or len(messages) <= 1:
@@ -322,38 +837,30 @@ async def execute_agent_workflow(
             }
         
         final_message = messages[-1].content
-        
+        serialized = _serialize_messages(messages)
+
         # Check for empty or error responses
         if not final_message or final_message.strip() == "":
             return {
                 "success": False,
                 "conversation_id": conversation_id,
                 "response": "⚠️ I encountered an issue. Please try again or contact support.",
-                "messages": [{"role": getattr(m, 'type', 'assistant'), "content": m.content} for m in messages],
+                "messages": serialized,
                 "metadata": {},
             }
-        
+
         return {
             "success": True,
             "conversation_id": conversation_id,
             "response": final_message,
-            "messages": [{"role": getattr(m, 'type', 'assistant'), "content": m.content} for m in messages],
-            "metadata": final_state.get("metadata", {}),
+            "messages": serialized,
+            "metadata": metadata,
         }
     
     except Exception as e:
         error_msg = str(e)
-        
-        # User-friendly error messages
-        if "429" in error_msg or "rate_limit" in error_msg.lower() or "too many requests" in error_msg.lower():
-            user_error = "⚠️ **API Rate Limit Reached**\n\nPlease wait a moment and try again. Our system is temporarily at capacity."
-        elif "timeout" in error_msg.lower():
-            user_error = "⏱️ **Request Timed Out**\n\nThe request took too long. Please try a simpler question or try again."
-        elif "connection" in error_msg.lower():
-            user_error = "🔌 **Connection Error**\n\nCouldn't connect to required services. Please check your connection and try again."
-        else:
-            user_error = f"❌ **Error Occurred**\n\n{error_msg[:150]}"
-        
+        user_error = _classify_error(error_msg)
+
         log.error(
             "Workflow execution failed",
             conversation_id=conversation_id,
@@ -372,10 +879,13 @@ async def execute_agent_workflow(
 
 
 async def close_checkpointer():
-    """Close checkpointer connection."""
-    global _checkpointer_cm, _checkpointer_instance
-    
-    if _checkpointer_cm and _checkpointer_instance:
-        await _checkpointer_cm.__aexit__(None, None, None)
-        _checkpointer_cm = None
-        _checkpointer_instance = None
+    """Close the checkpointer's connection pool."""
+    global _checkpointer_pool, _checkpointer_instance, _compiled_graph
+
+    if _checkpointer_pool is not None:
+        await _checkpointer_pool.close()
+        _checkpointer_pool = None
+    _checkpointer_instance = None
+
+    # The compiled graph holds the closed checkpointer; rebuild on next use
+    _compiled_graph = None
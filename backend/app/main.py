@@ -47,18 +47,41 @@ logging.getLogger('sqlalchemy.engine.Engine').disabled = True
 # ============================================================================
 # STEP 2: Now import everything else
 # ============================================================================
-import uuid
+import asyncio
 import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, status
+import orjson
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.config import settings
-from app.utils.logger import bind_context, clear_context, get_logger, setup_logging 
+from app.utils.logger import get_logger, setup_logging
 from psycopg.pq import error_message  
 from app.api.routes import agents, conversations, health
 from app.api.websockets import agent_updates
+from app.mcp.server import initialize_mcp_server, mcp_server
+
+
+def _build_mcp_app():
+    """
+    Build the FastMCP ASGI app when this fastmcp version provides one.
+
+    Newer fastmcp exposes http_app(), older releases sse_app(); with
+    neither (stdio-only builds) MCP stays unmounted and tools are still
+    reachable through the in-process registry.
+    """
+    factory = getattr(mcp_server, "http_app", None) or getattr(mcp_server, "sse_app", None)
+    if factory is None:
+        return None
+    try:
+        return factory()
+    except Exception as e:
+        log.error("Failed to build MCP ASGI app", error=str(e))
+        return None
+
+
+mcp_app = _build_mcp_app()
 
 # Logging Setup (must be first)
 # setup_logging()
@@ -81,24 +104,60 @@ async def lifespan(app: FastAPI):
     log.info("Application starting", environment=settings.ENVIRONMENT, debug=settings.DEBUG)
     
     # Initialize databases
-    from app.db.postgres import init_database, check_database_connection
+    from app.db.postgres import init_database, check_database_connection, warm_connection_pool
     from app.db.redis_cache import init_cache
     from app.db.vector_store import init_vector_store
-    
-    # Check PostgreSQL connection
-    if await check_database_connection():
-        await init_database()
-    else:
-        log.error("Failed to connect to PostgreSQL")
-    
-    # Initialize Redis cache
-    await init_cache()
-    
-    # Initialize vector store
-    await init_vector_store()
-    
+
+    async def _init_postgres():
+        if await check_database_connection():
+            await init_database()
+            await warm_connection_pool()
+        else:
+            log.error("Failed to connect to PostgreSQL")
+
+    # Postgres, Redis, and the vector store are independent I/O — run
+    # their init concurrently so startup takes max(init_i), not the sum.
+    # return_exceptions keeps one backend's failure from aborting the
+    # others (matching the old behavior of logging and carrying on).
+    results = await asyncio.gather(
+        _init_postgres(),
+        init_cache(),
+        init_vector_store(),
+        return_exceptions=True,
+    )
+    for name, result in zip(("postgres", "redis", "vector_store"), results):
+        if isinstance(result, BaseException):
+            log.error(f"{name} initialization failed", error=str(result))
+
+    # Fan agent updates out across workers (no-op without Redis);
+    # needs the Redis client from init_cache, so runs after the gather
+    from app.api.websockets.agent_updates import start_pubsub_listener
+    await start_pubsub_listener()
+
+    # Pre-warm the checkpointer pool and compiled graph so the first
+    # user request doesn't pay connection setup + setup() DDL + graph
+    # compilation on its critical path
+    from app.graphs.supervisor_graph import get_supervisor_graph
+    try:
+        await get_supervisor_graph()
+        log.info("Supervisor graph pre-warmed")
+    except Exception as e:
+        # Lazy init on first request still works; don't block startup
+        log.error("Supervisor graph pre-warm failed", error=str(e))
+
+    # Enter the MCP app's own lifespan so its transport and tool
+    # registration start now — mounting alone never runs a sub-app's
+    # startup hook, which would push that cost onto the first request
+    mcp_lifespan_cm = None
+    if mcp_app is not None:
+        mcp_lifespan = getattr(mcp_app, "lifespan", None)
+        if mcp_lifespan is not None:
+            mcp_lifespan_cm = mcp_lifespan(mcp_app)
+            await mcp_lifespan_cm.__aenter__()
+    await initialize_mcp_server()
+
     log.info("All database connections initialized")
-    
+
     # Calculate and display startup time
     STARTUP_TIME = time.time() - startup_start
     
@@ -113,13 +172,24 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     log.info("Application shutting down")
+    from app.agents.base_agent import close_shared_http_client
+    from app.mcp.tools.api_caller import close_http_client
     from app.db.postgres import close_database
     from app.db.redis_cache import close_cache
     from app.db.vector_store import close_vector_store
-    
+
+    from app.api.websockets.agent_updates import stop_pubsub_listener
+    from app.graphs.supervisor_graph import close_checkpointer
+
+    if mcp_lifespan_cm is not None:
+        await mcp_lifespan_cm.__aexit__(None, None, None)
+    await stop_pubsub_listener()
+    await close_checkpointer()
     await close_database()
     await close_cache()
     await close_vector_store()
+    await close_shared_http_client()
+    await close_http_client()
 
 
 
@@ -131,6 +201,9 @@ app = FastAPI(
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     lifespan=lifespan,
+    # orjson serializes responses (incl. datetimes) in one C-level pass,
+    # roughly halving serialization CPU on large conversation payloads
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -143,6 +216,12 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Request-ID + logging as a raw ASGI layer — avoids BaseHTTPMiddleware's
+# per-request task group and response buffering (see app/middleware)
+from app.middleware.request_id import RequestIDLoggingMiddleware
+
+app.add_middleware(RequestIDLoggingMiddleware)
+
 
 # =============================================================================
 # MOUNT ROUTERS
@@ -160,67 +239,23 @@ app.include_router(conversations.router, prefix="/api")
 # WebSocket routes
 app.include_router(agent_updates.router)
 
-log.info("All API routes mounted")
-
-
-
-@app.middleware("http")
-async def logging_middleware(request: Request, call_next):
-    """
-    Request logging middleware.
-    
-    This middleware:
-    1. Generates unique request ID
-    2. Binds request context (method, path, client IP)
-    3. Logs request start and completion
-    4. Measures request duration
-    5. Clears context after request
-    """
-    # Clear any existing context (prevents leakage between requests)
-    clear_context()
-
-    # Generate unique request ID
-    request_id = str(uuid.uuid4())
-
-    # Bind context for this request
-    bind_context(
-        request_id=request_id,
-        method=request.method,
-        path=request.url.path,
-        client_ip=request.client.host if request.client else "unknown",
-    )
-
-    # Log request start
-    log.info("Request started")
-
-    try:
-        # Process request
-        response = await call_next(request)
-
-        # Log request completion
-        log.info(
-            "Request completed",
-            status_code=response.status_code,
-        )
-
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+# MCP tool server (startup handled by the composed lifespan above)
+if mcp_app is not None:
+    app.mount("/mcp", mcp_app)
 
-        return response
+log.info("All API routes mounted")
 
-    except Exception as exc:
-        log.error(
-            "Request failed",
-            exc_info=exc,
-            error=str(exc),
-        )
-        raise
-    finally:
-        # Clear context after request
-        clear_context()
 
 
 
+# Root payload never changes — serialize it once at import
+_ROOT_BYTES = orjson.dumps(
+    {
+        "message": "Autonomous Multi-Agent Enterprise Intelligence System",
+        "docs": "/docs",
+        "health": "/api/health",
+    }
+)
 
 
 @app.get(
@@ -235,11 +270,7 @@ async def root():
     Returns:
         dict: Welcome messsage
     """
-    return {
-        "message": "Autonomous Multi-Agent Enterprise Intelligence System",
-        "docs": "/docs",
-        "health": "/api/health",
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # Error Handlers
@@ -275,12 +306,27 @@ async def global_exception_handler(request: Request, exc: Exception):
 if __name__ == "__main__":
     import uvicorn
 
+    try:
+        import uvloop  # noqa: F401  (ships with uvicorn[standard] on Linux)
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+
     uvicorn.run(
         "app.main.app",
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
+        # uvloop + httptools: C implementations of the event loop and
+        # HTTP parser — the whole app is async I/O bound, so this lifts
+        # throughput across every endpoint with no code changes
+        loop=loop_impl,
+        http="httptools",
+        # permessage-deflate shrinks repetitive agent-update JSON ~5-10x
+        # on the wire for WebSocket clients that negotiate it
+        ws="websockets",
+        ws_per_message_deflate=True,
     )
 
 # Uvicorn is a web server. It handles network communication - receiving 
@@ -18,6 +18,9 @@ SECURITY & RATE LIMITING:
 - TODO (Phase 3): Add rate limiting per domain
 """
 
+import json
+from typing import Optional
+
 import httpx
 
 from app.mcp.schemas import ApiCallInput, ApiCallOutput, HttpMethod
@@ -25,6 +28,32 @@ from app.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# A per-call AsyncClient paid DNS + TCP + TLS setup on every tool
+# invocation and could never reuse connections to the same host. One
+# shared client keeps pooled keep-alive connections across calls (same
+# pattern as the agents' shared LLM client in base_agent).
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the shared tool HTTP client."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=httpx.Timeout(30.0),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared tool HTTP client. Call at application shutdown."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        _client = None
+        log.info("Shared tool HTTP client closed")
+
 
 async def call_api(input_data: ApiCallInput) -> ApiCallOutput:
     """
@@ -55,44 +84,53 @@ async def call_api(input_data: ApiCallInput) -> ApiCallOutput:
     """
     
     try:
-        async with httpx.AsyncClient(timeout=input_data.timeout) as client:
-            # Prepare request
-            request_kwargs = {
-                "method": input_data.method,
-                "url": input_data.url,
-                "headers": input_data.headers or {},
-            }
-            
-            # Add body for POST/PUT/PATCH
-            if input_data.method in [HttpMethod.POST, HttpMethod.PUT, HttpMethod.PATCH]:
-                if input_data.body:
-                    request_kwargs["json"] = input_data.body
-            
-            # Make request
-            response = await client.request(**request_kwargs)
-            
-            # Parse response
+        client = get_http_client()
+
+        # Prepare request (per-call timeout overrides the client default)
+        request_kwargs = {
+            "method": input_data.method,
+            "url": input_data.url,
+            "headers": input_data.headers or {},
+            "timeout": httpx.Timeout(input_data.timeout),
+        }
+
+        # Add body for POST/PUT/PATCH
+        if input_data.method in [HttpMethod.POST, HttpMethod.PUT, HttpMethod.PATCH]:
+            if input_data.body:
+                request_kwargs["json"] = input_data.body
+
+        # Make request
+        response = await client.request(**request_kwargs)
+
+        # Parse response. Only attempt JSON decoding when the server says
+        # it sent JSON — trying to parse every HTML/text body just to
+        # catch the failure wastes a full decode pass on large responses.
+        content_type = response.headers.get("content-type", "")
+        if "json" in content_type:
             try:
                 response_data = response.json()
-            except Exception:
-                # If not JSON, return text
+            except (json.JSONDecodeError, ValueError):
+                # Mislabeled content type; fall back to text
                 response_data = response.text
-            
-            # Log API call
-            log.info(
-                "API call completed",
-                method=input_data.method,
-                url=input_data.url,
-                status_code=response.status_code,
-                response_size=len(response.text),
-            )
-            
-            return ApiCallOutput(
-                success=response.is_success,
-                status_code=response.status_code,
-                response_data=response_data,
-                headers=dict(response.headers),
-            )
+        else:
+            response_data = response.text
+
+        # Log API call (len(content) is the raw byte count and skips the
+        # charset decode that response.text would do just for a log field)
+        log.info(
+            "API call completed",
+            method=input_data.method,
+            url=input_data.url,
+            status_code=response.status_code,
+            response_size=len(response.content),
+        )
+
+        return ApiCallOutput(
+            success=response.is_success,
+            status_code=response.status_code,
+            response_data=response_data,
+            headers=dict(response.headers),
+        )
     
     except httpx.TimeoutException as e:
         log.warning("API call timeout", url=input_data.url, timeout=input_data.timeout)
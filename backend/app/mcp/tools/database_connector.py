@@ -21,6 +21,7 @@ The LLM needs to:
 We provide schema context in the tool description and agent prompts.
 """
 
+import re
 from typing import Any
 
 from sqlalchemy import text
@@ -31,6 +32,17 @@ from app.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Validation patterns compiled once at import. Case-insensitive matching
+# on the original query replaces the per-call .upper() copy, and word
+# boundaries stop false positives on identifiers like "created_at" or
+# "last_update" that merely contain a keyword.
+_SELECT_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+_FORBIDDEN_RE = re.compile(
+    r"\b(DROP|DELETE|UPDATE|INSERT|ALTER|CREATE|TRUNCATE|GRANT|REVOKE)\b",
+    re.IGNORECASE,
+)
+_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
 
 async def query_database(input_data: DatabaseQueryInput) -> DatabaseQueryOutput:
     """
@@ -64,27 +76,26 @@ async def query_database(input_data: DatabaseQueryInput) -> DatabaseQueryOutput:
     
     try:
         # Security: Validate query is SELECT only
-        query_upper = input_data.query.strip().upper()
-        if not query_upper.startswith("SELECT"):
+        if not _SELECT_RE.match(input_data.query):
             log.warning("Non-SELECT query attempted", query=input_data.query)
             return DatabaseQueryOutput(
                 success=False,
                 error="Only SELECT queries are allowed for security reasons"
             )
-        
+
         # Additional security checks
-        dangerous_keywords = ["DROP", "DELETE", "UPDATE", "INSERT", "ALTER", "CREATE"]
-        if any(keyword in query_upper for keyword in dangerous_keywords):
+        forbidden = _FORBIDDEN_RE.search(input_data.query)
+        if forbidden:
             return DatabaseQueryOutput(
                 success=False,
-                error=f"Query contains forbidden keyword: {dangerous_keywords}"
+                error=f"Query contains forbidden keyword: {forbidden.group(0).upper()}"
             )
-        
+
         # Execute query
         async with get_db_session() as db:
             # Add LIMIT if not present
             query = input_data.query
-            if "LIMIT" not in query_upper:
+            if not _LIMIT_RE.search(query):
                 query = f"{query} LIMIT {input_data.limit}"
             
             result = await db.execute(text(query))
@@ -117,18 +128,10 @@ async def query_database(input_data: DatabaseQueryInput) -> DatabaseQueryOutput:
         )
 
 
-def get_database_schema() -> str:
-    """
-    Get database schema description for agent context.
-    
-    PROMPT ENGINEERING:
-    This schema description is included in agent system prompts
-    to help LLM generate correct SQL queries.
-    
-    Returns:
-        Formatted schema description
-    """
-    return """
+# Module-level constant: built once at import, so every tool listing,
+# docstring format, and agent prompt that embeds the schema shares the
+# same interned string object
+_SCHEMA_STR = """
 DATABASE SCHEMA:
 
 Table: conversations
@@ -159,4 +162,18 @@ Common Query Patterns:
 - Agent performance: SELECT agent_name, AVG(duration_ms), COUNT(*) FROM agent_executions GROUP BY agent_name
 - Failed executions: SELECT * FROM agent_executions WHERE status = 'failed'
 - Token usage: SELECT SUM(tokens_used) FROM agent_executions WHERE DATE(started_at) = CURRENT_DATE
-"""
\ No newline at end of file
+"""
+
+
+def get_database_schema() -> str:
+    """
+    Get database schema description for agent context.
+
+    PROMPT ENGINEERING:
+    This schema description is included in agent system prompts
+    to help LLM generate correct SQL queries.
+
+    Returns:
+        Formatted schema description
+    """
+    return _SCHEMA_STR
\ No newline at end of file
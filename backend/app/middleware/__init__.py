@@ -0,0 +1 @@
+"""Custom ASGI middleware."""
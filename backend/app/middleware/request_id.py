@@ -0,0 +1,101 @@
+# agenticAI/backend/app/middleware/request_id.py
+
+"""
+Request-ID / logging middleware as a pure ASGI app.
+
+The previous @app.middleware("http") decorator wrapped the handler in
+Starlette's BaseHTTPMiddleware, which spins up an anyio task group and
+memory-object streams for every request and buffers streamed responses.
+Implementing the ASGI protocol directly does the same work — bind log
+context, log start/completion, inject X-Request-ID — with none of that
+per-request machinery, and stays transparent to StreamingResponse/SSE.
+"""
+
+import re
+import time
+
+from app.utils.fast_request_id import new_request_id
+from app.utils.logger import bind_context, clear_context, get_logger
+
+log = get_logger(__name__)
+
+# Load balancers and tracing proxies usually inject X-Request-Id
+# upstream; reusing it keeps distributed traces correlated and skips ID
+# generation. Accept only word chars and dashes, bounded length, so a
+# hostile header can't smuggle junk into logs or response headers.
+_INVALID_CHAR_RE = re.compile(rb"[^\w\-]")
+_MAX_REQUEST_ID_LEN = 255
+
+
+def _inbound_request_id(scope) -> bytes | None:
+    """Return a valid caller-supplied x-request-id, or None."""
+    for name, value in scope.get("headers", ()):
+        if name == b"x-request-id":
+            if 0 < len(value) <= _MAX_REQUEST_ID_LEN and not _INVALID_CHAR_RE.search(value):
+                return value
+            return None
+    return None
+
+
+class RequestIDLoggingMiddleware:
+    """
+    ASGI middleware that tags each HTTP request with an ID and logs it.
+
+    Responsibilities (same as the old http-middleware function):
+    1. Generate a unique request ID
+    2. Bind request context (method, path, client IP) for structlog
+    3. Log request start and completion with duration
+    4. Inject X-Request-ID into the response headers
+    5. Clear context afterwards so nothing leaks between requests
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Clear any existing context (prevents leakage between requests)
+        clear_context()
+
+        inbound = _inbound_request_id(scope)
+        request_id = inbound.decode() if inbound is not None else new_request_id()
+        client = scope.get("client")
+        bind_context(
+            request_id=request_id,
+            method=scope["method"],
+            path=scope["path"],
+            client_ip=client[0] if client else "unknown",
+        )
+
+        log.info("Request started")
+        started = time.perf_counter()
+        request_id_bytes = request_id.encode()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # Headers are a mutable list of (name, value) byte pairs
+                message.setdefault("headers", []).append(
+                    (b"x-request-id", request_id_bytes)
+                )
+                log.info(
+                    "Request completed",
+                    status_code=message["status"],
+                    duration_ms=round((time.perf_counter() - started) * 1000, 2),
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            log.error(
+                "Request failed",
+                exc_info=exc,
+                error=str(exc),
+            )
+            raise
+        finally:
+            # Clear context after request
+            clear_context()
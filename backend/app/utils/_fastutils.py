@@ -0,0 +1,76 @@
+# agenticAI/backend/app/utils/_fastutils.py
+
+"""
+JIT-compiled numeric helper for semantic cache lookups.
+
+The brute-force similarity scan in SemanticCache is a pure-numeric inner
+loop that bottlenecks on the interpreter when written in plain Python.
+When numba is installed it compiles to native code on first call
+(cache=True persists the compiled artifact across restarts, so the
+warmup cost is paid once per deploy, not per process). Without numba the
+caller should stay on its BLAS matmul path — the plain-Python fallback
+here exists only so imports never fail; check NUMBA_AVAILABLE first.
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator stand-in when numba isn't installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@njit(cache=True, fastmath=True)
+def _cos_sim_argmax_impl(query, bank):  # pragma: no cover - numba kernel
+    best_idx = -1
+    best_score = -2.0
+    qn = 0.0
+    for k in range(query.shape[0]):
+        qn += query[k] * query[k]
+    qn = qn ** 0.5
+    if qn == 0.0:
+        return -1, 0.0
+
+    for i in range(bank.shape[0]):
+        dot = 0.0
+        bn = 0.0
+        for k in range(bank.shape[1]):
+            dot += query[k] * bank[i, k]
+            bn += bank[i, k] * bank[i, k]
+        if bn == 0.0:
+            continue
+        score = dot / (qn * bn ** 0.5)
+        if score > best_score:
+            best_score = score
+            best_idx = i
+    return best_idx, best_score
+
+
+def cos_sim_argmax(query, bank) -> tuple[int, float]:
+    """
+    Index and score of the bank row most cosine-similar to query.
+
+    Used for semantic cache lookups (is this query close enough to a
+    cached one?). Returns (-1, 0.0) for an empty bank or zero query.
+    """
+    if not NUMPY_AVAILABLE or bank is None or len(bank) == 0:
+        return -1, 0.0
+    query = np.ascontiguousarray(query, dtype=np.float32)
+    bank = np.ascontiguousarray(bank, dtype=np.float32)
+    idx, score = _cos_sim_argmax_impl(query, bank)
+    return int(idx), float(score)
@@ -0,0 +1,38 @@
+# agenticAI/backend/app/utils/fast_request_id.py
+
+"""
+Fast request-ID generation for the logging middleware.
+
+uuid.uuid4() reads os.urandom (a syscall) and formats a dashed 36-char
+string on every HTTP request. Request IDs only need to be unique for
+log correlation, not cryptographically unpredictable, so a PRNG seeded
+once from the OS entropy pool and refilled in batches gives the same
+correlation value at a fraction of the cost: zero syscalls in the
+steady state and one 32-char hex string per request.
+"""
+
+import random
+import secrets
+
+# IDs pre-generated per refill; amortizes the generator calls
+_BATCH_SIZE = 256
+
+# Seeded once from OS entropy — IDs are unique in practice without
+# paying a urandom syscall per request
+_rng = random.Random(int.from_bytes(secrets.token_bytes(32), "big"))
+
+_buffer: list[str] = []
+
+
+def new_request_id() -> str:
+    """
+    Return a 32-char hex request ID from the pre-generated batch.
+
+    Single-threaded under asyncio (list ops are atomic under the GIL
+    anyway); a refill generates the next _BATCH_SIZE IDs in one go.
+    """
+    if not _buffer:
+        _buffer.extend(
+            f"{_rng.getrandbits(128):032x}" for _ in range(_BATCH_SIZE)
+        )
+    return _buffer.pop()
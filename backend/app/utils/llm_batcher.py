@@ -0,0 +1,144 @@
+# agenticAI/backend/app/utils/llm_batcher.py
+
+"""
+Micro-batching for Concurrent LLM Calls
+
+Coalesces LLM invocations that arrive within a small time window into a
+single provider `abatch` call, amortizing HTTP and tokenization overhead.
+
+How it works:
+1. execute() enqueues (messages, config, future) instead of calling ainvoke
+2. A background drain task collects up to MAX_BATCH requests or waits at
+   most MAX_WAIT_MS for stragglers
+3. One llm.abatch(...) call serves the whole batch; each future resolves
+   with its own response
+
+When N concurrent API requests hit the same (provider, model, temperature)
+agent, this turns N HTTP round-trips into ~N/MAX_BATCH.
+
+Only deterministic (temperature=0) agents without bound tools should use
+this — see BaseAgent.__init__ for the gating logic.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from app.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Largest number of requests coalesced into one provider call
+MAX_BATCH = 16
+
+# How long to wait for additional requests after the first arrival
+MAX_WAIT_MS = 10
+
+
+class LLMBatcher:
+    """
+    Coalesces concurrent invocations of one LLM into batched abatch calls.
+
+    One batcher per (provider, model, temperature) tuple — see get_batcher.
+    """
+
+    def __init__(
+        self,
+        llm,
+        max_batch: int = MAX_BATCH,
+        max_wait_ms: int = MAX_WAIT_MS,
+    ):
+        self.llm = llm
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def invoke(self, messages: list, config: Optional[dict] = None) -> Any:
+        """
+        Enqueue an invocation and await its batched result.
+
+        Args:
+            messages: Message list for the LLM
+            config: Optional per-call runnable config
+
+        Returns:
+            The LLM response for this invocation
+        """
+        self._ensure_drain_task()
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((messages, config, future))
+        return await future
+
+    def _ensure_drain_task(self) -> None:
+        """Start the drain loop lazily on first use (needs a running loop)."""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_loop())
+
+    async def _drain_loop(self) -> None:
+        """
+        Collect queued requests into batches and dispatch them.
+
+        Blocks on the first request, then waits up to max_wait for more
+        (bounded by max_batch) before issuing a single abatch call.
+        """
+        while True:
+            batch = [await self._queue.get()]
+
+            # Collect stragglers arriving within the batching window
+            deadline = asyncio.get_running_loop().time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: list) -> None:
+        """Issue one abatch call for the batch and resolve each future."""
+        message_lists = [item[0] for item in batch]
+        configs = [item[1] for item in batch]
+        futures = [item[2] for item in batch]
+
+        try:
+            if len(batch) == 1:
+                # No coalescing happened — plain ainvoke avoids batch overhead
+                responses = [await self.llm.ainvoke(message_lists[0], config=configs[0])]
+            else:
+                responses = await self.llm.abatch(message_lists, config=configs)
+                log.debug("LLM micro-batch dispatched", batch_size=len(batch))
+
+            for future, response in zip(futures, responses):
+                if not future.done():
+                    future.set_result(response)
+
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
+
+# Batcher registry: one per (provider class, model, temperature)
+_batchers: dict[tuple, LLMBatcher] = {}
+
+
+def get_batcher(key: tuple, llm) -> LLMBatcher:
+    """
+    Get or create the shared batcher for an LLM configuration.
+
+    Args:
+        key: (provider class name, model name, temperature) tuple
+        llm: The LLM instance to batch calls against
+
+    Returns:
+        Shared LLMBatcher for this configuration
+    """
+    if key not in _batchers:
+        _batchers[key] = LLMBatcher(llm)
+    return _batchers[key]
@@ -0,0 +1,303 @@
+# agenticAI/backend/app/utils/semantic_cache.py
+
+"""
+Semantic Response Cache for LLM Calls
+
+Caches agent LLM outputs keyed by the *meaning* of the prompt rather than
+its exact text, so paraphrased or repeated requests skip the provider
+round-trip entirely.
+
+How it works:
+1. Embed (agent name + system prompt hash + message + context) with a local
+   sentence-transformers model (all-MiniLM-L6-v2, 384 dimensions)
+2. Compare against stored embeddings with cosine similarity
+   (embeddings are L2-normalized, so similarity is a single dot product)
+3. Return the cached output when similarity >= threshold
+
+Why local embeddings?
+- No API quota consumed for cache lookups
+- Sub-millisecond lookup vs hundreds of ms for an LLM round-trip
+
+The cache is bounded (LRU eviction) and entirely optional: it can be
+switched off with SEMANTIC_CACHE_ENABLED=false, and if
+sentence-transformers/numpy are not installed, lookups are no-ops and
+agents fall through to the LLM as before.
+"""
+
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    EMBEDDINGS_AVAILABLE = False
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+from app.config import settings
+from app.utils._fastutils import NUMBA_AVAILABLE, cos_sim_argmax
+from app.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Cosine similarity required to count as a hit.
+# 0.87 is strict enough to avoid cross-question contamination while still
+# matching close paraphrases ("what's 2+2" vs "what is 2 + 2").
+SIMILARITY_THRESHOLD = 0.87
+
+# Maximum cached entries before LRU eviction kicks in
+MAX_ENTRIES = 1000
+
+# Embedding model (384 dimensions, ~80MB, CPU-friendly)
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
+# Above this many live entries, brute-force scanning starts to cost more
+# than a FAISS inner-product index; below it, the direct scan wins. Must
+# stay below MAX_ENTRIES or the FAISS branch can never trigger.
+FAISS_THRESHOLD = 512
+
+# How many inserts a FAISS index may lag behind before being rebuilt
+FAISS_REBUILD_INTERVAL = 256
+
+
+class SemanticCache:
+    """
+    Bounded similarity-based cache for agent LLM responses.
+
+    Entries are stored as L2-normalized embeddings alongside their outputs,
+    so a lookup is one matrix-vector product over all cached embeddings
+    followed by an argmax — no per-entry Python loop.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SIMILARITY_THRESHOLD,
+        max_entries: int = MAX_ENTRIES,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._model = None  # Lazy-loaded on first use
+        # aget/aput run get/put in worker threads, so model loading and
+        # the index bookkeeping need real (threading, not asyncio) locks
+        self._model_lock = threading.Lock()
+        self._lock = threading.Lock()
+        # LRU bookkeeping: key -> row index into the embedding matrix
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        # Preallocated embedding matrix (rows are L2-normalized); parallel
+        # arrays map row index -> output / key. Allocated on first put.
+        self._matrix = None
+        self._outputs: list = [None] * max_entries
+        self._row_keys: list = [None] * max_entries
+        self._n_used = 0
+        # FAISS index is only built past FAISS_THRESHOLD entries and is
+        # refreshed lazily every FAISS_REBUILD_INTERVAL inserts
+        self._faiss_index = None
+        self._faiss_pending = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Active only when configured on and the embedding stack exists."""
+        return EMBEDDINGS_AVAILABLE and settings.SEMANTIC_CACHE_ENABLED
+
+    def _get_model(self):
+        """Load embedding model on first use (avoids startup cost)."""
+        if self._model is None:
+            with self._model_lock:
+                # Double-checked: concurrent first lookups must not each
+                # load their own copy of the model
+                if self._model is None:
+                    self._model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+                    log.info(
+                        "Semantic cache embedding model loaded",
+                        model=EMBEDDING_MODEL_NAME,
+                    )
+        return self._model
+
+    @staticmethod
+    def make_key(agent_name: str, system_prompt: str, message: str, context_str: str = "") -> str:
+        """
+        Build cache key text from agent identity + prompt content.
+
+        The system prompt is hashed (it's long and static per agent) while
+        the message and context are kept verbatim so paraphrases embed close
+        to each other.
+        """
+        prompt_hash = hashlib.sha256(system_prompt.encode()).hexdigest()[:16]
+        return f"{agent_name}|{prompt_hash}|{message}|{context_str}"
+
+    def _embed(self, text: str):
+        """Embed and L2-normalize text for cosine similarity via dot product."""
+        embedding = self._get_model().encode(text, convert_to_numpy=True)
+        norm = np.linalg.norm(embedding)
+        if norm > 0:
+            embedding = embedding / norm
+        return embedding.astype(np.float32)
+
+    def get(self, key_text: str) -> Optional[str]:
+        """
+        Look up cached output for semantically similar prompt.
+
+        Args:
+            key_text: Key text from make_key()
+
+        Returns:
+            Cached output string, or None on miss
+        """
+        if not self.enabled or self._n_used == 0:
+            return None
+
+        try:
+            # Embed outside the lock — inference is the slow part and
+            # needs no shared state beyond the (separately locked) model
+            query = self._embed(key_text)
+            with self._lock:
+                row = self._search(query)
+
+                if row is not None:
+                    key = self._row_keys[row]
+                    # Move to end = most recently used
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    log.debug("Semantic cache hit")
+                    return self._outputs[row]
+
+                self.misses += 1
+                return None
+
+        except Exception as e:
+            log.warning("Semantic cache lookup failed", exc_info=e)
+            return None
+
+    def _search(self, query) -> Optional[int]:
+        """
+        Find the row whose embedding is most similar to the query.
+
+        Small caches scan the preallocated matrix directly: a fused
+        numba kernel when available (one pass, no temporary sims array),
+        otherwise one BLAS-backed matrix-vector product. Past
+        FAISS_THRESHOLD live entries, an inner-product FAISS index takes
+        over for sublinear search.
+
+        Returns:
+            Row index of the best match above threshold, or None
+        """
+        if FAISS_AVAILABLE and self._n_used > FAISS_THRESHOLD:
+            self._maybe_rebuild_faiss()
+            sims, indices = self._faiss_index.search(query[None, :], 1)
+            row = int(indices[0, 0])
+            if row < 0 or row >= self._n_used:
+                return None
+            # The index lags inserts by up to FAISS_REBUILD_INTERVAL, and
+            # LRU eviction reuses rows in place — so a hit can point at a
+            # row whose embedding (and output) changed since the last
+            # rebuild. Re-score against the live matrix row before
+            # trusting it; one dot product, no stale answers.
+            live_sim = float(self._matrix[row] @ query)
+            if live_sim >= self.threshold:
+                return row
+            return None
+
+        if NUMBA_AVAILABLE:
+            best, score = cos_sim_argmax(query, self._matrix[:self._n_used])
+            if best >= 0 and score >= self.threshold:
+                return best
+            return None
+
+        sims = self._matrix[:self._n_used] @ query
+        best = int(sims.argmax())
+        if sims[best] >= self.threshold:
+            return best
+        return None
+
+    def _maybe_rebuild_faiss(self) -> None:
+        """Rebuild the FAISS index when enough inserts have accumulated."""
+        if self._faiss_index is None or self._faiss_pending >= FAISS_REBUILD_INTERVAL:
+            index = faiss.IndexFlatIP(EMBEDDING_DIM)
+            index.add(self._matrix[:self._n_used])
+            self._faiss_index = index
+            self._faiss_pending = 0
+
+    def put(self, key_text: str, output: str) -> None:
+        """
+        Store output under embedded key, evicting LRU entries when full.
+
+        Args:
+            key_text: Key text from make_key()
+            output: LLM output to cache
+        """
+        if not self.enabled:
+            return
+
+        try:
+            embedding = self._embed(key_text)
+
+            with self._lock:
+                if self._matrix is None:
+                    self._matrix = np.zeros(
+                        (self.max_entries, EMBEDDING_DIM), dtype=np.float32
+                    )
+
+                if key_text in self._entries:
+                    row = self._entries[key_text]
+                elif self._n_used < self.max_entries:
+                    row = self._n_used
+                    self._n_used += 1
+                else:
+                    # Full: reuse the least-recently-used entry's row
+                    _, row = self._entries.popitem(last=False)
+
+                self._matrix[row] = embedding
+                self._outputs[row] = output
+                self._row_keys[row] = key_text
+                self._entries[key_text] = row
+                self._entries.move_to_end(key_text)
+                self._faiss_pending += 1
+
+        except Exception as e:
+            log.warning("Semantic cache store failed", exc_info=e)
+
+    async def aget(self, key_text: str) -> Optional[str]:
+        """
+        Async lookup: runs get() in a worker thread.
+
+        SentenceTransformer.encode is synchronous CPU-bound inference
+        (plus a multi-second model load on first call); running it
+        inline would block the event loop for every concurrent request.
+        """
+        if not self.enabled or self._n_used == 0:
+            return None
+        return await asyncio.to_thread(self.get, key_text)
+
+    async def aput(self, key_text: str, output: str) -> None:
+        """Async store: runs put() (embed included) in a worker thread."""
+        if not self.enabled:
+            return
+        await asyncio.to_thread(self.put, key_text, output)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._matrix = None
+        self._outputs = [None] * self.max_entries
+        self._row_keys = [None] * self.max_entries
+        self._n_used = 0
+        self._faiss_index = None
+        self._faiss_pending = 0
+        self.hits = 0
+        self.misses = 0
+
+
+# Module-level cache shared by all agents in this process
+semantic_cache = SemanticCache()
@@ -260,6 +260,23 @@ def temp_json_file(tmp_path):
 # CLEANUP FIXTURES
 # =============================================================================
 
+@pytest.fixture(autouse=True)
+def disable_semantic_cache(monkeypatch):
+    """
+    Keep the semantic LLM response cache out of tests.
+
+    Left enabled, any agent execute() in a test would load the real
+    ~80MB embedding model and leak cached answers across tests through
+    the module-global singleton. Tests that exercise the cache itself
+    re-enable it locally.
+    """
+    from app.utils.semantic_cache import semantic_cache
+
+    monkeypatch.setattr(settings, "SEMANTIC_CACHE_ENABLED", False)
+    yield
+    semantic_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def cleanup_test_data():
     """
@@ -0,0 +1,68 @@
+# backend/tests/test_agents/test_supervisor.py
+
+"""Unit Tests for Supervisor routing helpers."""
+
+import pytest
+from app.agents.supervisor import match_delegation_target, try_local_answer
+
+pytestmark = [pytest.mark.unit, pytest.mark.agents]
+
+
+class TestLocalArithmetic:
+    """Tests for the local arithmetic fast-path."""
+
+    def test_plain_expression(self):
+        """Test bare arithmetic expression."""
+        assert try_local_answer("2+2") == "4"
+
+    def test_question_prefix(self):
+        """Test 'what is' phrasing with parentheses."""
+        assert try_local_answer("What is (3+4)*2?") == "14"
+
+    def test_average_of_numbers(self):
+        """Test average extraction."""
+        assert try_local_answer("Calculate the average of 10, 20, 30") == "The average is 20"
+
+    def test_non_arithmetic_falls_through(self):
+        """Test that general questions return None."""
+        assert try_local_answer("What is machine learning?") is None
+
+    def test_unsafe_expression_falls_through(self):
+        """Test that code-like input is not evaluated."""
+        assert try_local_answer("__import__('os')") is None
+
+    def test_division_by_zero_falls_through(self):
+        """Test that invalid math returns None instead of raising."""
+        assert try_local_answer("1/0") is None
+
+    def test_small_exponent_evaluates(self):
+        """Test that bounded exponentiation still works."""
+        assert try_local_answer("2**10") == "1024"
+
+    def test_huge_exponent_falls_through(self):
+        """Test that tower exponentiation is rejected, not computed."""
+        assert try_local_answer("9**9**9") is None
+
+    def test_huge_base_falls_through(self):
+        """Test that oversized bases are rejected."""
+        assert try_local_answer("99999999**99") is None
+
+
+class TestDelegationMatching:
+    """Tests for the keyword delegation scan."""
+
+    def test_file_routes_to_data_ingestion(self):
+        """Test file keyword routing."""
+        assert match_delegation_target("needs to read a file") == "data_ingestion_agent"
+
+    def test_database_routes_to_query(self):
+        """Test database keyword routing."""
+        assert match_delegation_target("requires a database lookup") == "query_agent"
+
+    def test_priority_order_preserved(self):
+        """Test that data_ingestion wins over query when both match."""
+        assert match_delegation_target("file query") == "data_ingestion_agent"
+
+    def test_no_match_returns_none(self):
+        """Test that unmatched text returns None."""
+        assert match_delegation_target("nothing relevant here") is None
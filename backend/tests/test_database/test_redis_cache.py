@@ -0,0 +1,162 @@
+# backend/tests/test_database/test_redis_cache.py
+
+"""
+Unit Tests for the Redis cache manager.
+
+Runs entirely against the in-memory fallback (redis_client is None when
+connect() hasn't been called), so no Redis server is required. Covers
+the bounded TTL cache, batched mget/mset, and single-flight get_or_load.
+"""
+
+import asyncio
+
+import pytest
+
+from app.db.redis_cache import RedisCache, _LocalTTLCache
+
+pytestmark = pytest.mark.unit
+
+
+class TestLocalTTLCache:
+    """Tests for the in-memory fallback store."""
+
+    def test_set_then_get(self):
+        """Test basic roundtrip."""
+        local = _LocalTTLCache(maxsize=10, default_ttl=60)
+        local.set("key", {"a": 1})
+        assert local.get("key") == {"a": 1}
+
+    def test_expired_entry_misses(self, monkeypatch):
+        """Test that entries disappear after their TTL."""
+        import app.db.redis_cache as rc
+
+        now = 1000.0
+        monkeypatch.setattr(rc.time, "monotonic", lambda: now)
+
+        local = _LocalTTLCache(maxsize=10, default_ttl=60)
+        local.set("key", "value", ttl=5)
+
+        now = 1004.0
+        assert local.get("key") == "value"
+        now = 1006.0
+        assert local.get("key") is None
+
+    def test_lru_eviction_bounds_size(self):
+        """Test that the oldest entry is evicted at capacity."""
+        local = _LocalTTLCache(maxsize=2, default_ttl=60)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.set("c", 3)
+
+        assert local.get("a") is None
+        assert local.get("b") == 2
+        assert local.get("c") == 3
+
+    def test_get_refreshes_recency(self):
+        """Test that a read protects an entry from eviction."""
+        local = _LocalTTLCache(maxsize=2, default_ttl=60)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+
+        assert local.get("a") == 1
+        assert local.get("b") is None
+
+
+class TestRedisCacheFallback:
+    """Tests for RedisCache operations on the in-memory fallback."""
+
+    @pytest.mark.asyncio
+    async def test_set_then_get(self):
+        """Test basic roundtrip without Redis."""
+        cache = RedisCache()
+        await cache.set("key", {"a": 1})
+        assert await cache.get("key") == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_get_missing_returns_none(self):
+        """Test that unknown keys miss."""
+        cache = RedisCache()
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_entry(self):
+        """Test that deleted keys miss afterwards."""
+        cache = RedisCache()
+        await cache.set("key", "value")
+        await cache.delete("key")
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_mset_then_mget_aligned(self):
+        """Test that mget returns values aligned with keys, None for misses."""
+        cache = RedisCache()
+        await cache.mset({"k1": "v1", "k2": "v2"})
+
+        assert await cache.mget(["k1", "missing", "k2"]) == ["v1", None, "v2"]
+
+    @pytest.mark.asyncio
+    async def test_mget_empty_keys(self):
+        """Test that an empty key list short-circuits."""
+        cache = RedisCache()
+        assert await cache.mget([]) == []
+
+
+class TestGetOrLoad:
+    """Tests for single-flight cache loading."""
+
+    @pytest.mark.asyncio
+    async def test_miss_runs_loader_and_caches(self):
+        """Test that a miss loads, caches, and returns the value."""
+        cache = RedisCache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return "loaded"
+
+        assert await cache.get_or_load("key", loader) == "loaded"
+        assert await cache.get("key") == "loaded"
+
+        # Second call hits the cache, loader untouched
+        assert await cache.get_or_load("key", loader) == "loaded"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        """Test that a stampede runs the loader exactly once."""
+        cache = RedisCache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "loaded"
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("key", loader) for _ in range(5))
+        )
+
+        assert results == ["loaded"] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_loader_error_propagates_and_allows_retry(self):
+        """Test that a failed load raises, clears in-flight state, and retries."""
+        cache = RedisCache()
+
+        async def failing_loader():
+            raise ValueError("db down")
+
+        with pytest.raises(ValueError):
+            await cache.get_or_load("key", failing_loader)
+
+        assert cache._inflight == {}
+
+        async def good_loader():
+            return "recovered"
+
+        assert await cache.get_or_load("key", good_loader) == "recovered"
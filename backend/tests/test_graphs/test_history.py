@@ -0,0 +1,67 @@
+# backend/tests/test_graphs/test_history.py
+
+"""Unit Tests for conversation-history trimming."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from app.graphs.history import estimate_tokens, trim_history
+
+pytestmark = pytest.mark.unit
+
+
+class TestEstimateTokens:
+    """Tests for token estimation."""
+
+    def test_empty_string_is_cheap(self):
+        """Test that empty text costs at most one token."""
+        assert estimate_tokens("") <= 1
+
+    def test_longer_text_costs_more(self):
+        """Test that estimates grow with text length."""
+        assert estimate_tokens("word " * 100) > estimate_tokens("word")
+
+
+class TestTrimHistory:
+    """Tests for trim_history budget enforcement."""
+
+    def test_empty_history_unchanged(self):
+        """Test that an empty list passes through."""
+        assert trim_history([], max_tokens=100) == []
+
+    def test_history_within_budget_unchanged(self):
+        """Test that a short thread is returned as-is (same object)."""
+        messages = [HumanMessage(content="hi"), AIMessage(content="hello")]
+        assert trim_history(messages, max_tokens=1000) is messages
+
+    def test_oldest_messages_dropped_first(self):
+        """Test that trimming keeps the newest messages."""
+        messages = [
+            HumanMessage(content="oldest " * 50),
+            AIMessage(content="middle " * 50),
+            HumanMessage(content="newest"),
+        ]
+
+        trimmed = trim_history(messages, max_tokens=10)
+
+        assert trimmed[-1].content == "newest"
+        assert all(m.content != messages[0].content for m in trimmed)
+
+    def test_dropped_turns_summarized(self):
+        """Test that dropped turns collapse into one leading system note."""
+        messages = [
+            HumanMessage(content="first question " * 30),
+            AIMessage(content="first answer " * 30),
+            HumanMessage(content="latest"),
+        ]
+
+        trimmed = trim_history(messages, max_tokens=10)
+
+        assert isinstance(trimmed[0], SystemMessage)
+        assert "2 earlier turn(s)" in trimmed[0].content
+
+    def test_newest_message_always_kept(self):
+        """Test that even an over-budget newest message is retained."""
+        messages = [HumanMessage(content="enormous " * 500)]
+        trimmed = trim_history(messages, max_tokens=1)
+        assert trimmed[-1] is messages[0]
@@ -0,0 +1,164 @@
+# backend/tests/test_graphs/test_supervisor_graph.py
+
+"""
+Unit Tests for supervisor graph infrastructure.
+
+Covers the routing-decision cache (TTL, LRU bound) and request
+coalescing (duplicate sharing, error propagation) without running the
+graph or any LLM call.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.agents.supervisor import RoutingDecision
+from app.graphs import supervisor_graph as sg
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def clean_module_state():
+    """Reset the routing cache and in-flight map around each test."""
+    sg._routing_cache.clear()
+    sg._inflight.clear()
+    yield
+    sg._routing_cache.clear()
+    sg._inflight.clear()
+
+
+def _decision(reasoning: str = "test") -> RoutingDecision:
+    return RoutingDecision(
+        can_answer_directly=True,
+        direct_answer="cached answer",
+        delegate_to="FINISH",
+        reasoning=reasoning,
+    )
+
+
+class TestRoutingCache:
+    """Tests for the routing decision cache."""
+
+    def test_key_ignores_whitespace_and_case(self):
+        """Test that normalized variants of a message collide."""
+        key1 = sg._routing_cache_key("What is   X?", [])
+        key2 = sg._routing_cache_key("  what is x?  ", [])
+        assert key1 == key2
+
+    def test_key_differs_with_history(self):
+        """Test that different history produces different keys."""
+        from langchain_core.messages import HumanMessage
+
+        key1 = sg._routing_cache_key("question", [])
+        key2 = sg._routing_cache_key("question", [HumanMessage(content="earlier")])
+        assert key1 != key2
+
+    @pytest.mark.asyncio
+    async def test_put_then_get_roundtrip(self):
+        """Test that a stored decision is returned before expiry."""
+        decision = _decision()
+        await sg._routing_cache_put("key", decision)
+        assert await sg._routing_cache_get("key") is decision
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_misses(self):
+        """Test that an entry past its TTL is dropped on read."""
+        sg._routing_cache["key"] = (_decision(), time.monotonic() - 1)
+
+        assert await sg._routing_cache_get("key") is None
+        assert "key" not in sg._routing_cache
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_bounds_size(self):
+        """Test that the cache never exceeds ROUTING_CACHE_MAX."""
+        for i in range(sg.ROUTING_CACHE_MAX + 10):
+            await sg._routing_cache_put(f"key-{i}", _decision())
+
+        assert len(sg._routing_cache) == sg.ROUTING_CACHE_MAX
+        assert await sg._routing_cache_get("key-0") is None
+        assert await sg._routing_cache_get(f"key-{sg.ROUTING_CACHE_MAX + 9}") is not None
+
+
+class TestRequestCoalescing:
+    """Tests for in-flight duplicate coalescing."""
+
+    def test_key_scoped_to_user_and_conversation(self):
+        """Test that the same message for different users never collides."""
+        key1 = sg._inflight_key("hello", "conv-1", "user-a")
+        key2 = sg._inflight_key("hello", "conv-1", "user-b")
+        assert key1 != key2
+
+    @pytest.mark.asyncio
+    async def test_duplicates_share_one_execution(self, monkeypatch):
+        """Test that concurrent identical requests run the workflow once."""
+        calls = 0
+
+        async def fake_workflow(user_message, conversation_id=None, user_id=None):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return {"success": True, "response": "shared"}
+
+        monkeypatch.setattr(sg, "_execute_workflow", fake_workflow)
+
+        results = await asyncio.gather(
+            sg.execute_agent_workflow("same question", "conv-1", "user-a"),
+            sg.execute_agent_workflow("same question", "conv-1", "user-a"),
+            sg.execute_agent_workflow("same question", "conv-1", "user-a"),
+        )
+
+        assert calls == 1
+        assert all(r["response"] == "shared" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_different_conversations_not_coalesced(self, monkeypatch):
+        """Test that the same message in different threads runs twice."""
+        calls = 0
+
+        async def fake_workflow(user_message, conversation_id=None, user_id=None):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return {"success": True, "response": conversation_id}
+
+        monkeypatch.setattr(sg, "_execute_workflow", fake_workflow)
+
+        await asyncio.gather(
+            sg.execute_agent_workflow("same question", "conv-1", "user-a"),
+            sg.execute_agent_workflow("same question", "conv-2", "user-a"),
+        )
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_wakes_duplicates(self, monkeypatch):
+        """Test that a failing original propagates an error to duplicates."""
+
+        async def failing_workflow(user_message, conversation_id=None, user_id=None):
+            await asyncio.sleep(0.02)
+            raise ValueError("provider exploded")
+
+        monkeypatch.setattr(sg, "_execute_workflow", failing_workflow)
+
+        results = await asyncio.gather(
+            sg.execute_agent_workflow("bad question", "conv-1", "user-a"),
+            sg.execute_agent_workflow("bad question", "conv-1", "user-a"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, Exception) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_inflight_map_cleared_after_completion(self, monkeypatch):
+        """Test that finished requests leave no in-flight entry behind."""
+
+        async def fake_workflow(user_message, conversation_id=None, user_id=None):
+            return {"success": True, "response": "done"}
+
+        monkeypatch.setattr(sg, "_execute_workflow", fake_workflow)
+
+        await sg.execute_agent_workflow("question", "conv-1", "user-a")
+
+        assert sg._inflight == {}
@@ -0,0 +1,103 @@
+# backend/tests/test_utils/test_llm_batcher.py
+
+"""Unit Tests for LLM micro-batching."""
+
+import asyncio
+
+import pytest
+
+from app.utils.llm_batcher import LLMBatcher
+
+pytestmark = pytest.mark.unit
+
+
+class FakeLLM:
+    """Records ainvoke/abatch calls and answers deterministically."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.ainvoke_calls = 0
+        self.abatch_calls = 0
+        self.abatch_sizes: list[int] = []
+
+    async def ainvoke(self, messages, config=None):
+        self.ainvoke_calls += 1
+        if self.fail:
+            raise RuntimeError("provider down")
+        return f"response:{messages[0]}"
+
+    async def abatch(self, message_lists, config=None):
+        self.abatch_calls += 1
+        self.abatch_sizes.append(len(message_lists))
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [f"response:{messages[0]}" for messages in message_lists]
+
+
+class TestLLMBatcher:
+    """Tests for request coalescing into abatch calls."""
+
+    @pytest.mark.asyncio
+    async def test_single_call_uses_ainvoke(self):
+        """Test that a lone request skips batch overhead."""
+        llm = FakeLLM()
+        batcher = LLMBatcher(llm, max_wait_ms=5)
+
+        result = await batcher.invoke(["q1"])
+
+        assert result == "response:q1"
+        assert llm.ainvoke_calls == 1
+        assert llm.abatch_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_coalesce(self):
+        """Test that requests in the same window share one abatch call."""
+        llm = FakeLLM()
+        batcher = LLMBatcher(llm, max_wait_ms=50)
+
+        results = await asyncio.gather(
+            batcher.invoke(["q1"]),
+            batcher.invoke(["q2"]),
+            batcher.invoke(["q3"]),
+        )
+
+        assert results == ["response:q1", "response:q2", "response:q3"]
+        assert llm.abatch_calls == 1
+        assert llm.abatch_sizes == [3]
+
+    @pytest.mark.asyncio
+    async def test_batch_capped_at_max_batch(self):
+        """Test that an oversized burst is split across dispatches."""
+        llm = FakeLLM()
+        batcher = LLMBatcher(llm, max_batch=2, max_wait_ms=50)
+
+        results = await asyncio.gather(*(batcher.invoke([f"q{i}"]) for i in range(4)))
+
+        assert len(results) == 4
+        assert all(size <= 2 for size in llm.abatch_sizes)
+
+    @pytest.mark.asyncio
+    async def test_provider_error_propagates_to_all_callers(self):
+        """Test that a failed batch rejects every awaiting future."""
+        llm = FakeLLM(fail=True)
+        batcher = LLMBatcher(llm, max_wait_ms=50)
+
+        results = await asyncio.gather(
+            batcher.invoke(["q1"]),
+            batcher.invoke(["q2"]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_batcher_survives_a_failed_batch(self):
+        """Test that the drain loop keeps serving after an error."""
+        llm = FakeLLM(fail=True)
+        batcher = LLMBatcher(llm, max_wait_ms=5)
+
+        with pytest.raises(RuntimeError):
+            await batcher.invoke(["q1"])
+
+        llm.fail = False
+        assert await batcher.invoke(["q2"]) == "response:q2"
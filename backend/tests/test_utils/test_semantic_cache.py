@@ -0,0 +1,76 @@
+# backend/tests/test_utils/test_semantic_cache.py
+
+"""
+Tests for Semantic Response Cache
+
+Verifies cache key construction, hit/miss behavior, and LRU eviction.
+Embedding-dependent tests are skipped when sentence-transformers is
+not installed.
+"""
+
+import pytest
+from app.config import settings
+from app.utils.semantic_cache import SemanticCache, EMBEDDINGS_AVAILABLE
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def enable_semantic_cache(monkeypatch):
+    """These tests exercise the cache itself — undo the global disable."""
+    monkeypatch.setattr(settings, "SEMANTIC_CACHE_ENABLED", True)
+
+
+class TestSemanticCache:
+    """Tests for semantic cache functionality."""
+
+    def test_make_key_is_deterministic(self):
+        """Test that identical inputs produce identical keys."""
+        key1 = SemanticCache.make_key("agent", "prompt", "message", "context")
+        key2 = SemanticCache.make_key("agent", "prompt", "message", "context")
+        assert key1 == key2
+
+    def test_make_key_differs_per_agent(self):
+        """Test that different agents get different keys for same message."""
+        key1 = SemanticCache.make_key("agent_a", "prompt", "message")
+        key2 = SemanticCache.make_key("agent_b", "prompt", "message")
+        assert key1 != key2
+
+    def test_get_on_empty_cache_returns_none(self):
+        """Test that lookup on empty cache misses."""
+        cache = SemanticCache()
+        assert cache.get("agent|hash|what is 2+2|") is None
+
+    @pytest.mark.skipif(not EMBEDDINGS_AVAILABLE, reason="sentence-transformers not installed")
+    def test_put_then_get_exact_match(self):
+        """Test that an exact repeat of a cached prompt hits."""
+        cache = SemanticCache()
+        key = SemanticCache.make_key("test_agent", "prompt", "what is 2+2")
+
+        cache.put(key, "4")
+
+        assert cache.get(key) == "4"
+        assert cache.hits == 1
+
+    @pytest.mark.skipif(not EMBEDDINGS_AVAILABLE, reason="sentence-transformers not installed")
+    def test_lru_eviction_bounds_size(self):
+        """Test that cache never exceeds max_entries."""
+        cache = SemanticCache(max_entries=2)
+
+        for i in range(5):
+            key = SemanticCache.make_key("test_agent", "prompt", f"question {i}")
+            cache.put(key, f"answer {i}")
+
+        assert len(cache._entries) == 2
+
+    def test_clear_resets_state(self):
+        """Test that clear drops entries and counters."""
+        cache = SemanticCache()
+        cache.hits = 5
+        cache.misses = 3
+
+        cache.clear()
+
+        assert cache.hits == 0
+        assert cache.misses == 0
+        assert len(cache._entries) == 0